@@ -2,11 +2,6 @@
 
 __version__ = "0.1.0"
 
-from .analyzer import CommitAnalyzer
-from .claude_client import ClaudeClient
-from .config import Config, get_config
-from .github_client import GitHubClient
-
 __all__ = [
     "CommitAnalyzer",
     "ClaudeClient",
@@ -14,3 +9,27 @@ __all__ = [
     "get_config",
     "GitHubClient",
 ]
+
+# Lazy re-exports (PEP 562): importing the package must not pull in the
+# SDK-heavy client modules, or the CLI pays their import cost before
+# click even parses --help
+_EXPORTS = {
+    "CommitAnalyzer": "analyzer",
+    "ClaudeClient": "claude_client",
+    "Config": "config",
+    "get_config": "config",
+    "GitHubClient": "github_client",
+}
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,9 @@
+"""Precompiled patterns shared across modules."""
+
+import re
+
+# GitHub commit URL; used by MessageParser and GitHubClient.parse_commit_url
+COMMIT_URL_PATTERN = re.compile(
+    r"github\.com/(?P<owner>[^/\s]+)/(?P<repo>[^/\s]+)/commit/(?P<sha>[a-f0-9]{7,40})",
+    re.IGNORECASE | re.ASCII
+)
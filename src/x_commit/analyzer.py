@@ -1,10 +1,17 @@
 """Core analyzer engine that coordinates GitHub and Claude clients."""
 
+import functools
+import hashlib
 import logging
+import re
+import threading
+from concurrent.futures import Future
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Callable, Optional, Tuple
 
+from . import heuristics
+from .cache import get_analysis_cache, is_cache_disabled
 from .claude_client import ClaudeClient
 from .config import get_config
 from .formatter import MarkdownFormatter
@@ -13,6 +20,106 @@ from .github_client import CommitInfo, FileChange, GitHubClient
 logger = logging.getLogger(__name__)
 
 
+# Splits a formatted diff at the per-file headers emitted by
+# GitHubClient.format_diff, keeping the headers with their sections
+_FILE_SECTION_PATTERN = re.compile(r"(?=\n={60}\nFile: )")
+
+_FILE_NAME_PATTERN = re.compile(r"^File: (\S+)", re.MULTILINE)
+
+# Lines preserved at each end of a trimmed file section; the window
+# halves down to the minimum when one pass is not enough
+_TRIM_EDGE_LINES = 40
+_TRIM_MIN_EDGE_LINES = 5
+
+
+def _estimate_tokens(text: str) -> int:
+    """Approximate the token count of a text (~4 characters per token)."""
+    return len(text) // 4
+
+
+def trim_diff(diff: str, max_tokens: int) -> str:
+    """Trim a formatted diff to an approximate token budget.
+
+    Large commits can push LLM input to tens of thousands of tokens.
+    Rather than cutting the diff at a fixed line count, this drops the
+    middle of the largest file sections, keeping _TRIM_EDGE_LINES lines
+    at each end and halving that window (down to _TRIM_MIN_EDGE_LINES)
+    until the estimate fits, so every file keeps its header and the
+    shape of its changes. The budget is best-effort: a commit touching
+    very many files can still exceed it on headers and edge lines alone,
+    in which case ClaudeClient's max_diff_lines cut bounds the request.
+
+    Args:
+        diff: Diff text as produced by GitHubClient.format_diff
+        max_tokens: Approximate token budget
+
+    Returns:
+        The diff, trimmed if necessary, with omitted regions marked as
+        `[... N lines omitted ...]`
+    """
+    if _estimate_tokens(diff) <= max_tokens:
+        return diff
+
+    sections = _FILE_SECTION_PATTERN.split(diff)
+    trimmed_files: list[str] = []
+
+    edge = _TRIM_EDGE_LINES
+    while edge >= _TRIM_MIN_EDGE_LINES:
+        untrimmable: set[int] = set()
+
+        while _estimate_tokens("".join(sections)) > max_tokens:
+            candidates = [
+                i for i in range(len(sections)) if i not in untrimmable
+            ]
+            if not candidates:
+                break
+
+            largest = max(candidates, key=lambda i: len(sections[i]))
+            lines = sections[largest].split("\n")
+
+            if len(lines) <= edge * 2 + 1:
+                untrimmable.add(largest)
+                continue
+
+            omitted = len(lines) - edge * 2
+            sections[largest] = "\n".join(
+                lines[:edge]
+                + [f"[... {omitted} lines omitted ...]"]
+                + lines[-edge:]
+            )
+            untrimmable.add(largest)
+
+            name_match = _FILE_NAME_PATTERN.search(sections[largest])
+            trimmed_files.append(name_match.group(1) if name_match else "<unknown>")
+
+        if _estimate_tokens("".join(sections)) <= max_tokens:
+            break
+        edge //= 2
+
+    if trimmed_files:
+        logger.info(
+            f"Trimmed diff to ~{_estimate_tokens(''.join(sections))} tokens "
+            f"(budget {max_tokens}); files trimmed: "
+            f"{', '.join(dict.fromkeys(trimmed_files))}"
+        )
+
+    return "".join(sections)
+
+
+def _normalize_diff(diff: str) -> str:
+    """Normalize a diff for content hashing.
+
+    Drops git `index abc..def` header lines and trailing whitespace so
+    cosmetic differences (e.g. between a commit and its cherry-pick) hash
+    to the same value.
+    """
+    return "\n".join(
+        line.rstrip()
+        for line in diff.splitlines()
+        if not line.startswith("index ")
+    )
+
+
 class CommitAnalyzer:
     """Analyzes GitHub commits using Claude AI."""
 
@@ -30,6 +137,13 @@ class CommitAnalyzer:
         self.github_client = github_client or GitHubClient()
         self.claude_client = claude_client or ClaudeClient()
         self.config = get_config()
+
+        # Single-flight: concurrent analyses of the same (repo, sha, lang,
+        # model) coalesce into one Claude call; late arrivals wait on the
+        # first caller's future instead of spending a duplicate request
+        self._inflight: dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+
         logger.info("CommitAnalyzer initialized")
 
     def analyze_by_url(
@@ -78,10 +192,140 @@ class CommitAnalyzer:
 
         return commit_info, analysis
 
-    def _analyze_commit(
+    def analyze_batch(
+        self, commits: list[tuple[str, str, str]], language: str = "korean"
+    ) -> list[Tuple[CommitInfo, str]]:
+        """Analyze several commits with a single Claude request.
+
+        Cached commits are served locally; the remaining ones are combined
+        into one batched API call.
+
+        Args:
+            commits: List of (owner, repo, sha) tuples
+            language: Language for analysis ('korean' or 'english')
+
+        Returns:
+            List of (CommitInfo, analysis_text) tuples, in input order
+        """
+        lang = "english" if language.lower() == "english" else "korean"
+        logger.info(f"Starting batch analysis of {len(commits)} commits")
+
+        cache = None if is_cache_disabled() else get_analysis_cache()
+
+        fetched = [
+            self.github_client.get_commit(owner, repo, sha)
+            for owner, repo, sha in commits
+        ]
+
+        analyses: list[Optional[str]] = [None] * len(fetched)
+        pending: list[int] = []
+        diffs: list[Optional[str]] = [None] * len(fetched)
+
+        for i, (commit_info, file_changes) in enumerate(fetched):
+            diff = trim_diff(
+                self.github_client.format_diff(file_changes),
+                self.config.max_diff_tokens,
+            )
+            diffs[i] = diff
+
+            if cache is not None:
+                cached = cache.get(self._cache_key(commit_info, lang))
+                if cached is None:
+                    cached = cache.get(
+                        self._content_key(commit_info.message, diff, lang)
+                    )
+                if cached is not None:
+                    logger.info(
+                        f"Analysis cache hit for {commit_info.sha[:8]} ({lang})"
+                    )
+                    analyses[i] = cached
+                    continue
+
+            pending.append(i)
+
+        if pending:
+            batch_input = [
+                {
+                    "commit_message": fetched[i][0].message,
+                    "diff": diffs[i],
+                    "repository": fetched[i][0].repository,
+                    "author": fetched[i][0].author_name,
+                }
+                for i in pending
+            ]
+            batch_results = self.claude_client.analyze_commits_batch(
+                batch_input, language=lang
+            )
+
+            for i, analysis in zip(pending, batch_results):
+                analyses[i] = analysis
+                if cache is not None:
+                    commit_info = fetched[i][0]
+                    cache.set(self._cache_key(commit_info, lang), analysis)
+                    cache.set(
+                        self._content_key(commit_info.message, diffs[i], lang),
+                        analysis,
+                    )
+
+        return [
+            (commit_info, analyses[i])
+            for i, (commit_info, _) in enumerate(fetched)
+        ]
+
+    async def aanalyze_by_url(
+        self, commit_url: str, language: str = "korean"
+    ) -> Tuple[CommitInfo, str]:
+        """Analyze a commit by its GitHub URL (async version).
+
+        Args:
+            commit_url: GitHub commit URL
+            language: Language for analysis ('korean' or 'english')
+
+        Returns:
+            Tuple of (CommitInfo, analysis_text)
+        """
+        logger.info(f"Starting async analysis for URL: {commit_url}")
+
+        # Fetch commit from GitHub
+        commit_info, file_changes = await self.github_client.aget_commit_by_url(
+            commit_url
+        )
+
+        # Analyze the commit
+        analysis = await self._aanalyze_commit(commit_info, file_changes, language)
+
+        return commit_info, analysis
+
+    async def aanalyze_by_sha(
+        self, owner: str, repo: str, sha: str, language: str = "korean"
+    ) -> Tuple[CommitInfo, str]:
+        """Analyze a commit by repository and SHA (async version).
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            sha: Commit SHA
+            language: Language for analysis ('korean' or 'english')
+
+        Returns:
+            Tuple of (CommitInfo, analysis_text)
+        """
+        logger.info(f"Starting async analysis for {owner}/{repo}@{sha}")
+
+        # Fetch commit from GitHub
+        commit_info, file_changes = await self.github_client.aget_commit(
+            owner, repo, sha
+        )
+
+        # Analyze the commit
+        analysis = await self._aanalyze_commit(commit_info, file_changes, language)
+
+        return commit_info, analysis
+
+    async def _aanalyze_commit(
         self, commit_info: CommitInfo, file_changes: list[FileChange], language: str
     ) -> str:
-        """Perform the actual analysis using Claude.
+        """Perform the actual analysis using Claude (async version).
 
         Args:
             commit_info: Commit information
@@ -91,16 +335,202 @@ class CommitAnalyzer:
         Returns:
             Analysis text
         """
-        # Format the diff
-        diff = self.github_client.format_diff(file_changes)
+        lang = "english" if language.lower() == "english" else "korean"
+
+        # Trivial commits get a local summary instead of a Claude call
+        heuristic = heuristics.classify(
+            file_changes, lang, commit_message=commit_info.message
+        )
+        if heuristic is not None:
+            logger.info(
+                f"Heuristic summary for {commit_info.sha[:8]} "
+                f"(skipped_claude=True)"
+            )
+            return heuristic
+
+        # Check the persistent cache first (commit SHAs are immutable)
+        cache = None if is_cache_disabled() else get_analysis_cache()
+        cache_key = self._cache_key(commit_info, lang)
+        if cache is not None:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Analysis cache hit for {commit_info.sha[:8]} ({lang})")
+                return cached
+
+        # Format the diff and trim it to the configured token budget
+        diff = trim_diff(
+            self.github_client.format_diff(file_changes),
+            self.config.max_diff_tokens,
+        )
+
+        # Content-addressed lookup: cherry-picks and rebases get new SHAs
+        # but carry identical message + diff content
+        content_key = None
+        if cache is not None:
+            content_key = self._content_key(commit_info.message, diff, lang)
+            cached = cache.get(content_key)
+            if cached is not None:
+                logger.info(
+                    f"Content cache hit for {commit_info.sha[:8]} ({lang})"
+                )
+                cache.set(cache_key, cached)
+                return cached
 
         # Get analysis from Claude
-        if language.lower() == "english":
+        if lang == "english":
+            analysis = await self.claude_client.aanalyze_commit_english(
+                commit_message=commit_info.message,
+                diff=diff,
+                repository=commit_info.repository,
+                author=commit_info.author_name,
+            )
+        else:
+            analysis = await self.claude_client.aanalyze_commit(
+                commit_message=commit_info.message,
+                diff=diff,
+                repository=commit_info.repository,
+                author=commit_info.author_name,
+            )
+
+        if cache is not None:
+            cache.set(cache_key, analysis)
+            cache.set(content_key, analysis)
+
+        return analysis
+
+    def _cache_key(self, commit_info: CommitInfo, lang: str) -> str:
+        """Build the SHA-addressed cache key for a commit analysis."""
+        return (
+            f"{commit_info.repository}:{commit_info.sha}:{lang}:"
+            f"{self.claude_client.model}"
+        )
+
+    def _content_key(self, commit_message: str, diff: str, lang: str) -> str:
+        """Build the content-addressed cache key for a commit analysis."""
+        digest = hashlib.blake2b(
+            f"{commit_message}\0{_normalize_diff(diff)}".encode(),
+            digest_size=16,
+        ).hexdigest()
+        return f"content:{lang}:{self.claude_client.model}:{digest}"
+
+    def _analyze_commit(
+        self,
+        commit_info: CommitInfo,
+        file_changes: list[FileChange],
+        language: str,
+        on_text: Optional[Callable[[str], None]] = None,
+    ) -> str:
+        """Analyze a commit, coalescing concurrent duplicate requests.
+
+        Two Slack events for the same commit arriving within seconds each
+        used to trigger a Claude call; now the first caller runs the
+        analysis and later callers block on its future. Only the first
+        caller's on_text streams.
+
+        Args:
+            commit_info: Commit information
+            file_changes: List of file changes
+            language: Language for analysis
+            on_text: Optional streaming callback, forwarded to the Claude
+                client; not invoked on cache hits or coalesced requests
+
+        Returns:
+            Analysis text
+        """
+        lang = "english" if language.lower() == "english" else "korean"
+        key = self._cache_key(commit_info, lang)
+
+        with self._inflight_lock:
+            existing = self._inflight.get(key)
+            if existing is None:
+                future: Future = Future()
+                self._inflight[key] = future
+
+        if existing is not None:
+            logger.info(f"Waiting on in-flight analysis for {key}")
+            return existing.result()
+
+        try:
+            analysis = self._run_analysis(
+                commit_info, file_changes, lang, on_text
+            )
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(analysis)
+            return analysis
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def _run_analysis(
+        self,
+        commit_info: CommitInfo,
+        file_changes: list[FileChange],
+        lang: str,
+        on_text: Optional[Callable[[str], None]] = None,
+    ) -> str:
+        """Perform the actual analysis using Claude.
+
+        Args:
+            commit_info: Commit information
+            file_changes: List of file changes
+            lang: Normalized language ('korean' or 'english')
+            on_text: Optional streaming callback, forwarded to the Claude
+                client; not invoked on cache hits
+
+        Returns:
+            Analysis text
+        """
+
+        # Trivial commits get a local summary instead of a Claude call
+        heuristic = heuristics.classify(
+            file_changes, lang, commit_message=commit_info.message
+        )
+        if heuristic is not None:
+            logger.info(
+                f"Heuristic summary for {commit_info.sha[:8]} "
+                f"(skipped_claude=True)"
+            )
+            return heuristic
+
+        # Check the persistent cache first (commit SHAs are immutable)
+        cache = None if is_cache_disabled() else get_analysis_cache()
+        cache_key = self._cache_key(commit_info, lang)
+        if cache is not None:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Analysis cache hit for {commit_info.sha[:8]} ({lang})")
+                return cached
+
+        # Format the diff and trim it to the configured token budget
+        diff = trim_diff(
+            self.github_client.format_diff(file_changes),
+            self.config.max_diff_tokens,
+        )
+
+        # Content-addressed lookup: cherry-picks and rebases get new SHAs
+        # but carry identical message + diff content
+        content_key = None
+        if cache is not None:
+            content_key = self._content_key(commit_info.message, diff, lang)
+            cached = cache.get(content_key)
+            if cached is not None:
+                logger.info(
+                    f"Content cache hit for {commit_info.sha[:8]} ({lang})"
+                )
+                cache.set(cache_key, cached)
+                return cached
+
+        # Get analysis from Claude
+        if lang == "english":
             analysis = self.claude_client.analyze_commit_english(
                 commit_message=commit_info.message,
                 diff=diff,
                 repository=commit_info.repository,
                 author=commit_info.author_name,
+                on_text=on_text,
             )
         else:
             analysis = self.claude_client.analyze_commit(
@@ -108,8 +538,13 @@ class CommitAnalyzer:
                 diff=diff,
                 repository=commit_info.repository,
                 author=commit_info.author_name,
+                on_text=on_text,
             )
 
+        if cache is not None:
+            cache.set(cache_key, analysis)
+            cache.set(content_key, analysis)
+
         return analysis
 
     def generate_report(
@@ -174,3 +609,14 @@ class CommitAnalyzer:
         report = self.generate_report(commit_info, file_changes, analysis, output_path)
 
         return report
+
+
+@functools.lru_cache(maxsize=1)
+def get_analyzer() -> CommitAnalyzer:
+    """Get the process-wide CommitAnalyzer instance.
+
+    The analyzer owns the single-flight table and the GitHub/Claude
+    clients, so sharing one instance lets repeated CLI and bot calls
+    reuse warm connections and coalesce duplicate analyses.
+    """
+    return CommitAnalyzer()
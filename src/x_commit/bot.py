@@ -1,14 +1,19 @@
 """Slack bot server for analyzing GitHub commits."""
 
+import json
 import logging
+import queue
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from slack_bolt import App
 from slack_bolt.adapter.socket_mode import SocketModeHandler
 from slack_sdk.errors import SlackApiError
 
-from .analyzer import CommitAnalyzer
+from .analyzer import get_analyzer
+from .cache import DEFAULT_CACHE_DIR
 from .config import get_config
 from .ignore_patterns import IgnorePatternManager
 from .message_parser import MessageParser
@@ -16,6 +21,45 @@ from .slack_client import SlackClient
 
 logger = logging.getLogger(__name__)
 
+# Window within which a re-delivered Slack event is treated as a duplicate
+EVENT_DEDUP_WINDOW_SECONDS = 60.0
+
+# On-disk cache of resolved channel IDs: {workspace_id: {name: id}}
+_CHANNEL_CACHE_PATH = DEFAULT_CACHE_DIR / "channels.json"
+
+# Attachment fields that can carry GitHub commit URLs
+_ATTACHMENT_TEXT_FIELDS = ("text", "fallback", "title", "title_link", "pretext")
+
+
+def _iter_candidate_texts(message: dict):
+    """Yield every text fragment of a Slack message that may hold a URL.
+
+    Covers the top-level text, attachment fields used by the GitHub Slack
+    app, and Block Kit section/element texts, so callers can join the
+    fragments and run the commit parser once instead of per field.
+    """
+    text = message.get("text")
+    if isinstance(text, str):
+        yield text
+
+    for attachment in message.get("attachments", []):
+        for field in _ATTACHMENT_TEXT_FIELDS:
+            value = attachment.get(field)
+            if isinstance(value, str):
+                yield value
+
+    for block in message.get("blocks", []):
+        block_text = block.get("text")
+        if isinstance(block_text, dict):
+            value = block_text.get("text")
+            if isinstance(value, str):
+                yield value
+        for element in block.get("elements", []):
+            if isinstance(element, dict):
+                value = element.get("text")
+                if isinstance(value, str):
+                    yield value
+
 
 class CommitAnalyzerBot:
     """Slack bot that analyzes GitHub commits automatically."""
@@ -41,10 +85,31 @@ class CommitAnalyzerBot:
 
         # Initialize clients
         self.slack_client = SlackClient()
-        self.analyzer = CommitAnalyzer()
+        self.analyzer = get_analyzer()
         self.parser = MessageParser()
         self.ignore_manager = IgnorePatternManager(self.config.ignore_file_path)
 
+        # Bounded worker pool for analyses; unbounded thread-per-event
+        # spawning oversubscribes the GIL under commit bursts
+        self._max_workers = self.config.max_concurrent_analyses
+        self.pool = ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="xc-analyze"
+        )
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+
+        # Event queue: handlers ack immediately and enqueue; dispatcher
+        # threads do the routing work off Slack's request path
+        self._event_queue: queue.Queue = queue.Queue()
+        self._seen_events: dict[tuple[str, str, str], float] = {}
+        self._seen_lock = threading.Lock()
+        for i in range(2):
+            threading.Thread(
+                target=self._drain_events,
+                name=f"xc-dispatch-{i}",
+                daemon=True,
+            ).start()
+
         # Resolve channel ID if channel name is provided
         self.target_channel_id = None
         if self.config.slack_channel:
@@ -55,16 +120,47 @@ class CommitAnalyzerBot:
 
         logger.info("CommitAnalyzerBot initialized")
 
+    def _workspace_id(self) -> str:
+        """Get the workspace (team) ID for namespacing the channel cache."""
+        try:
+            response = self.slack_client.client.auth_test()
+            return response.get("team_id") or "default"
+        except Exception as e:
+            logger.debug(f"Could not determine workspace ID: {e}")
+            return "default"
+
+    @staticmethod
+    def _load_channel_cache() -> dict:
+        """Load the on-disk channel ID cache, tolerating a missing file."""
+        try:
+            return json.loads(_CHANNEL_CACHE_PATH.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _save_channel_cache(cache: dict) -> None:
+        """Write the channel ID cache back to disk (best effort)."""
+        try:
+            _CHANNEL_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            _CHANNEL_CACHE_PATH.write_text(
+                json.dumps(cache), encoding="utf-8"
+            )
+        except OSError as e:
+            logger.warning(f"Failed to save channel cache: {e}")
+
     def _resolve_channel_id(self, channel: str) -> str:
         """Resolve channel name to channel ID.
 
+        Resolutions are cached in ~/.cache/x-commit/channels.json keyed by
+        workspace, so repeat startups skip the conversations.list scan.
+
         Args:
             channel: Channel name (#commits) or ID (C08GS45FD8W)
 
         Returns:
             Channel ID or channel name if resolution fails
         """
-        # If it already looks like an ID, return as-is
+        # If it already looks like an ID, return as-is (no API call)
         if channel.startswith('C') or channel.startswith('G'):
             logger.info(f"Channel '{channel}' is already an ID")
             return channel
@@ -72,18 +168,36 @@ class CommitAnalyzerBot:
         # Remove # prefix if present
         channel_name = channel.lstrip('#')
 
+        # Check the on-disk cache before touching the API
+        workspace = self._workspace_id()
+        cache = self._load_channel_cache()
+        cached_id = cache.get(workspace, {}).get(channel_name)
+        if cached_id:
+            logger.info(f"Resolved channel '{channel}' from cache: {cached_id}")
+            return cached_id
+
         try:
-            # Try to find channel by name
+            # Page through channels with a cursor, stopping at the first
+            # name match instead of pulling up to 1000 channels at once
             # Note: This requires 'channels:read' and 'groups:read' scopes
-            response = self.slack_client.client.conversations_list(
-                types="public_channel,private_channel",
-                limit=1000
-            )
+            cursor = None
+            while True:
+                response = self.slack_client.client.conversations_list(
+                    types="public_channel,private_channel",
+                    limit=200,
+                    cursor=cursor,
+                )
+
+                for ch in response.get("channels", []):
+                    if ch.get("name") == channel_name:
+                        logger.info(f"Resolved channel '{channel}' to ID: {ch['id']}")
+                        cache.setdefault(workspace, {})[channel_name] = ch["id"]
+                        self._save_channel_cache(cache)
+                        return ch["id"]
 
-            for ch in response.get("channels", []):
-                if ch.get("name") == channel_name:
-                    logger.info(f"Resolved channel '{channel}' to ID: {ch['id']}")
-                    return ch["id"]
+                cursor = response.get("response_metadata", {}).get("next_cursor")
+                if not cursor:
+                    break
 
             # If not found, return channel name (will be used for matching)
             logger.info(f"Could not resolve channel name '{channel}', will use name for matching")
@@ -93,223 +207,283 @@ class CommitAnalyzerBot:
             logger.info(f"Could not resolve channel '{channel}' (missing scope or API error), will use name for matching")
             return channel_name
 
+    def _submit_analysis(self, fn, *args):
+        """Submit an analysis task to the bounded worker pool.
+
+        Posts a queued notice when the backlog is deep so users know their
+        request was accepted but is waiting for a worker.
+
+        Args:
+            fn: Analysis function (e.g. _analyze_and_post)
+            *args: Arguments for fn; the last two must be (channel, thread_ts)
+        """
+        channel, thread_ts = args[-2], args[-1]
+
+        with self._pending_lock:
+            self._pending += 1
+            backlog = self._pending
+
+        if backlog > self._max_workers * 2:
+            logger.warning(f"Analysis backlog is deep: {backlog} pending tasks")
+            try:
+                self.slack_client.post_message(
+                    channel,
+                    ":hourglass_flowing_sand: 분석 요청이 대기열에 추가되었습니다. "
+                    "잠시 후 순서대로 처리됩니다.",
+                    thread_ts,
+                )
+            except Exception as e:
+                logger.warning(f"Failed to post queued notice: {e}")
+
+        def _run():
+            try:
+                fn(*args)
+            finally:
+                with self._pending_lock:
+                    self._pending -= 1
+
+        self.pool.submit(_run)
+
+    def _enqueue_event(self, kind: str, event: dict, client):
+        """Queue a Slack event for processing, dropping recent duplicates.
+
+        Slack re-delivers events that are not acked quickly; the dedup set
+        keeps re-transmits within EVENT_DEDUP_WINDOW_SECONDS from
+        triggering a second analysis. The kind is part of the key because
+        one message can legitimately arrive as both a "message" and an
+        "app_mention" event with the same channel/ts.
+
+        Args:
+            kind: Event type ("message" or "app_mention")
+            event: Raw Slack event payload
+            client: Slack WebClient provided by Bolt
+        """
+        key = (kind, event.get("channel", ""), event.get("event_ts") or event.get("ts", ""))
+        now = time.monotonic()
+
+        with self._seen_lock:
+            seen_at = self._seen_events.get(key)
+            if seen_at is not None and now - seen_at < EVENT_DEDUP_WINDOW_SECONDS:
+                logger.info(f"Dropping duplicate Slack event for {key}")
+                return
+            self._seen_events[key] = now
+
+            # Prune expired entries so the set doesn't grow unbounded
+            if len(self._seen_events) > 1000:
+                self._seen_events = {
+                    k: t
+                    for k, t in self._seen_events.items()
+                    if now - t < EVENT_DEDUP_WINDOW_SECONDS
+                }
+
+        self._event_queue.put((kind, event, client))
+
+    def _drain_events(self):
+        """Dispatcher loop: pull queued events and run the routing logic."""
+        while True:
+            kind, event, client = self._event_queue.get()
+            try:
+                if kind == "message":
+                    self._handle_message_event(event, client)
+                else:
+                    self._handle_mention_event(event, client)
+            except Exception as e:
+                logger.error(f"Failed to process {kind} event: {e}", exc_info=True)
+            finally:
+                self._event_queue.task_done()
+
     def _register_handlers(self):
-        """Register Slack event handlers."""
+        """Register Slack event handlers.
+
+        Handlers ack within Slack's 3-second window and hand the raw
+        event to the internal queue; Slack retries events that are not
+        acked in time, which previously caused duplicate analyses.
+        """
 
         # Register message event handler if auto-analyze mode is enabled
         if self.config.slack_auto_analyze:
             @self.app.event("message")
-            def handle_message(event, client, logger):
-                """Handle GitHub commit messages - auto-analyze mode."""
-                # Log all incoming messages for debugging
-                channel = event.get("channel")
-                logger.info(f"Received message event from channel: {channel}")
-
-                # Ignore threaded messages (replies)
-                if event.get("thread_ts"):
-                    logger.debug(f"Skipping threaded message in channel {channel}")
-                    return
-
-                # Only process messages from configured channel if set
-                if self.target_channel_id:
-                    # Match by channel ID or try to get channel name and match
-                    if channel != self.target_channel_id:
-                        # If target is not an ID (e.g., "commits"), try to match channel name
-                        # This requires fetching channel info, but we can skip for now
-                        # and just compare IDs since Slack always sends channel IDs in events
-                        logger.info(f"Skipping message from channel {channel}, not matching target {self.target_channel_id}")
-                        logger.info(f"To fix: Set SLACK_CHANNEL={channel} in .env if this is the correct channel")
-                        return
-
-                # Check if message has GitHub commit URL in attachments
-                # GitHub Slack app uses attachments for commit messages
-                commits = []
-                full_message_text = ""
-
-                # Debug: Log the full event structure
-                logger.debug(f"Full event data: {event}")
-
-                # First check attachments (GitHub Slack app uses these)
-                if "attachments" in event:
-                    logger.debug(f"Attachments found: {event['attachments']}")
-                    for attachment in event["attachments"]:
-                        # Check various fields in attachment
-                        for field in ["text", "fallback", "title", "title_link", "pretext"]:
-                            if field in attachment:
-                                full_message_text += str(attachment[field]) + " "
-
-                # Also check message text
-                message_text = event.get("text", "")
-                full_message_text += message_text
-
-                logger.info(f"Full message text for parsing: {full_message_text[:200]}")
-
-                # Check if message matches ignore patterns
-                should_ignore, matched_pattern = self.ignore_manager.should_ignore(full_message_text)
-                if should_ignore:
-                    logger.info(f"Message matches ignore pattern '{matched_pattern}', skipping analysis")
-                    return
-
-                # Extract all commits from the combined message text
-                if full_message_text.strip():
-                    commits = self.parser.extract_all_commits(full_message_text)
-                    if commits:
-                        logger.info(f"Found {len(commits)} commit(s) in message from channel {channel}")
-
-                # Filter commits by target branches if configured
-                if self.config.slack_target_branches:
-                    filtered_commits = []
-                    for commit in commits:
-                        if commit.branch:
-                            # Check if branch matches target branches
-                            if commit.branch in self.config.slack_target_branches:
-                                filtered_commits.append(commit)
-                                logger.info(f"Commit {commit.sha[:8]} is from target branch: {commit.branch}")
-                            else:
-                                logger.info(f"Skipping commit {commit.sha[:8]} from non-target branch: {commit.branch}")
-                        else:
-                            # No branch info available, skip this commit
-                            logger.info(f"Skipping commit {commit.sha[:8]} - no branch information available")
-
-                    commits = filtered_commits
-                    if not commits:
-                        logger.info(f"No commits match target branches: {', '.join(self.config.slack_target_branches)}")
-
-                # Analyze each commit in a separate thread
-                for commit in commits:
-                    logger.info(
-                        f"Auto-analyzing commit {commit.sha[:8]} from channel {channel}"
-                    )
-                    threading.Thread(
-                        target=self._analyze_and_post,
-                        args=(commit, channel, event.get("ts")),
-                        daemon=True,
-                    ).start()
+            def handle_message(ack, event, client):
+                ack()
+                self._enqueue_event("message", event, client)
 
         @self.app.event("app_mention")
-        def handle_mention(event, client, logger):
-            """Handle app mentions - analyze commit in thread."""
-            # Get the message that was mentioned
-            channel = event.get("channel")
-            thread_ts = event.get("thread_ts") or event.get("ts")
-
-            # Check if this is a thread reply
-            if event.get("thread_ts"):
-                # Get the parent message (thread starter)
-                try:
-                    response = client.conversations_replies(
-                        channel=channel,
-                        ts=thread_ts,
-                        limit=1
-                    )
-                    parent_message = response["messages"][0]
-
-                    # Debug: Log the full parent message structure
-                    logger.info(f"Parent message structure: {parent_message}")
-
-                    parent_text = parent_message.get("text", "")
-                    logger.info(f"Parent text content: {parent_text}")
-
-                    # Try to parse from text first
-                    commit = self.parser.parse_message(parent_text)
-
-                    # If not found in text, check attachments (GitHub Slack app uses these)
-                    if not commit and "attachments" in parent_message:
-                        logger.info("Checking attachments for GitHub URL...")
-                        for attachment in parent_message["attachments"]:
-                            logger.info(f"Attachment: {attachment}")
-                            # Check various fields in attachment
-                            for field in ["text", "fallback", "title", "title_link"]:
-                                if field in attachment:
-                                    logger.info(f"Checking attachment.{field}: {attachment[field]}")
-                                    commit = self.parser.parse_message(str(attachment[field]))
-                                    if commit:
-                                        logger.info(f"Found commit in attachment.{field}")
-                                        break
-                            if commit:
-                                break
-
-                    # If still not found, check blocks (Block Kit format)
-                    if not commit and "blocks" in parent_message:
-                        logger.info("Checking blocks for GitHub URL...")
-                        for block in parent_message["blocks"]:
-                            logger.info(f"Block: {block}")
-                            # Extract text from various block elements
-                            if "text" in block and isinstance(block["text"], dict):
-                                text_content = block["text"].get("text", "")
-                                logger.info(f"Checking block text: {text_content}")
-                                commit = self.parser.parse_message(text_content)
-                                if commit:
-                                    logger.info("Found commit in block text")
-                                    break
-                            # Check elements in block
-                            if "elements" in block:
-                                for element in block["elements"]:
-                                    if "text" in element:
-                                        text_content = element.get("text", "")
-                                        logger.info(f"Checking element text: {text_content}")
-                                        commit = self.parser.parse_message(text_content)
-                                        if commit:
-                                            logger.info("Found commit in element text")
-                                            break
-                            if commit:
-                                break
-
-                    if commit:
-                        logger.info(
-                            f"Analyzing commit {commit.sha[:8]} from mention in thread"
-                        )
-                        # Analyze the commit
-                        threading.Thread(
-                            target=self._analyze_and_post,
-                            args=(commit, channel, thread_ts),
-                            daemon=True,
-                        ).start()
+        def handle_mention(ack, event, client):
+            ack()
+            self._enqueue_event("app_mention", event, client)
+
+    def _handle_message_event(self, event, client):
+        """Handle GitHub commit messages - auto-analyze mode."""
+        # Log all incoming messages for debugging
+        channel = event.get("channel")
+        logger.info(f"Received message event from channel: {channel}")
+
+        # Ignore threaded messages (replies)
+        if event.get("thread_ts"):
+            logger.debug(f"Skipping threaded message in channel {channel}")
+            return
+
+        # Only process messages from configured channel if set
+        if self.target_channel_id:
+            # Match by channel ID or try to get channel name and match
+            if channel != self.target_channel_id:
+                # If target is not an ID (e.g., "commits"), try to match channel name
+                # This requires fetching channel info, but we can skip for now
+                # and just compare IDs since Slack always sends channel IDs in events
+                logger.info(f"Skipping message from channel {channel}, not matching target {self.target_channel_id}")
+                logger.info(f"To fix: Set SLACK_CHANNEL={channel} in .env if this is the correct channel")
+                return
+
+        # Check if message has GitHub commit URL in attachments
+        # GitHub Slack app uses attachments for commit messages
+        commits = []
+
+        # Debug: Log the full event structure
+        logger.debug(f"Full event data: {event}")
+
+        # Join only the fragments that are actually strings; str() on a
+        # nested dict/list field produced a huge repr for the regex to scan
+        full_message_text = "\n".join(_iter_candidate_texts(event))
+
+        logger.info(f"Full message text for parsing: {full_message_text[:200]}")
+
+        # Check if message matches ignore patterns
+        should_ignore, matched_pattern = self.ignore_manager.should_ignore(full_message_text)
+        if should_ignore:
+            logger.info(f"Message matches ignore pattern '{matched_pattern}', skipping analysis")
+            return
+
+        # Extract all commits from the combined message text
+        if full_message_text.strip():
+            commits = self.parser.extract_all_commits(full_message_text)
+            if commits:
+                logger.info(f"Found {len(commits)} commit(s) in message from channel {channel}")
+
+        # Filter commits by target branches if configured
+        if self.config.slack_target_branches:
+            filtered_commits = []
+            for commit in commits:
+                if commit.branch:
+                    # Check if branch matches target branches
+                    if commit.branch in self.config.slack_target_branches:
+                        filtered_commits.append(commit)
+                        logger.info(f"Commit {commit.sha[:8]} is from target branch: {commit.branch}")
                     else:
-                        # No commit found in parent message
-                        client.chat_postMessage(
-                            channel=channel,
-                            thread_ts=thread_ts,
-                            text=":warning: 쓰레드의 원본 메시지에서 GitHub 커밋 URL을 찾을 수 없습니다.\n\n"
-                                 "사용법: GitHub 커밋이 포함된 메시지의 쓰레드에서 `@x-commit`을 멘션하세요."
-                        )
-                except Exception as e:
-                    logger.error(f"Failed to get parent message: {e}")
-                    client.chat_postMessage(
-                        channel=channel,
-                        thread_ts=thread_ts,
-                        text=f":x: 메시지를 가져오는 중 오류가 발생했습니다: {e}"
-                    )
-            else:
-                # Direct mention (not in thread)
-                # Check current message for commit URL
-                message_text = event.get("text", "")
-                commit = self.parser.parse_message(message_text)
+                        logger.info(f"Skipping commit {commit.sha[:8]} from non-target branch: {commit.branch}")
+                else:
+                    # No branch info available, skip this commit
+                    logger.info(f"Skipping commit {commit.sha[:8]} - no branch information available")
+
+            commits = filtered_commits
+            if not commits:
+                logger.info(f"No commits match target branches: {', '.join(self.config.slack_target_branches)}")
+
+        # Batch multi-commit messages into one Claude call;
+        # single commits keep the one-off path
+        if len(commits) > 1:
+            logger.info(
+                f"Auto-analyzing batch of {len(commits)} commits "
+                f"from channel {channel}"
+            )
+            self._submit_analysis(
+                self._analyze_and_post_batch,
+                commits, channel, event.get("ts"),
+            )
+        else:
+            for commit in commits:
+                logger.info(
+                    f"Auto-analyzing commit {commit.sha[:8]} from channel {channel}"
+                )
+                self._submit_analysis(
+                    self._analyze_and_post,
+                    commit, channel, event.get("ts"),
+                )
+
+    def _handle_mention_event(self, event, client):
+        """Handle app mentions - analyze commit in thread."""
+        # Get the message that was mentioned
+        channel = event.get("channel")
+        thread_ts = event.get("thread_ts") or event.get("ts")
+
+        # Check if this is a thread reply
+        if event.get("thread_ts"):
+            # Get the parent message (thread starter)
+            try:
+                response = client.conversations_replies(
+                    channel=channel,
+                    ts=thread_ts,
+                    limit=1
+                )
+                parent_message = response["messages"][0]
+
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Parent message structure: {parent_message}")
+
+                # Join text, attachment, and block fragments and run the
+                # parser once over the combined payload
+                combined_text = "\n".join(_iter_candidate_texts(parent_message))
+                commit = self.parser.parse_message(combined_text)
 
                 if commit:
-                    logger.info(f"Analyzing commit {commit.sha[:8]} from direct mention")
-                    threading.Thread(
-                        target=self._analyze_and_post,
-                        args=(commit, channel, event.get("ts")),
-                        daemon=True,
-                    ).start()
+                    logger.info(
+                        f"Analyzing commit {commit.sha[:8]} from mention in thread"
+                    )
+                    # Analyze the commit
+                    self._submit_analysis(self._analyze_and_post, commit, channel, thread_ts)
                 else:
+                    # No commit found in parent message
                     client.chat_postMessage(
                         channel=channel,
-                        thread_ts=event.get("ts"),
-                        text=":wave: 안녕하세요! X-Commit 봇입니다.\n\n"
-                             "*사용법:*\n"
-                             "1. GitHub 커밋 메시지의 쓰레드에서 `@x-commit`을 멘션\n"
-                             "2. 또는 커밋 URL과 함께 `@x-commit` 멘션\n\n"
-                             "*지원하는 URL 형식:*\n"
-                             "• `https://github.com/owner/repo/commit/sha`\n"
-                             "• Slack 링크: `<https://github.com/...>`\n"
-                             "• Markdown: `[text](https://github.com/...)`\n\n"
-                             "*예시:*\n"
-                             "```\n"
-                             "@x-commit https://github.com/owner/repo/commit/abc123\n"
-                             "```"
+                        thread_ts=thread_ts,
+                        text=":warning: 쓰레드의 원본 메시지에서 GitHub 커밋 URL을 찾을 수 없습니다.\n\n"
+                             "사용법: GitHub 커밋이 포함된 메시지의 쓰레드에서 `@x-commit`을 멘션하세요."
                     )
+            except Exception as e:
+                logger.error(f"Failed to get parent message: {e}")
+                client.chat_postMessage(
+                    channel=channel,
+                    thread_ts=thread_ts,
+                    text=f":x: 메시지를 가져오는 중 오류가 발생했습니다: {e}"
+                )
+        else:
+            # Direct mention (not in thread)
+            # Check current message for commit URLs
+            message_text = event.get("text", "")
+            commits = self.parser.extract_all_commits(message_text)
+
+            if len(commits) > 1:
+                logger.info(
+                    f"Analyzing batch of {len(commits)} commits "
+                    "from direct mention"
+                )
+                self._submit_analysis(
+                    self._analyze_and_post_batch,
+                    commits, channel, event.get("ts"),
+                )
+            elif commits:
+                commit = commits[0]
+                logger.info(f"Analyzing commit {commit.sha[:8]} from direct mention")
+                self._submit_analysis(
+                    self._analyze_and_post,
+                    commit, channel, event.get("ts"),
+                )
+            else:
+                client.chat_postMessage(
+                    channel=channel,
+                    thread_ts=event.get("ts"),
+                    text=":wave: 안녕하세요! X-Commit 봇입니다.\n\n"
+                         "*사용법:*\n"
+                         "1. GitHub 커밋 메시지의 쓰레드에서 `@x-commit`을 멘션\n"
+                         "2. 또는 커밋 URL과 함께 `@x-commit` 멘션\n\n"
+                         "*지원하는 URL 형식:*\n"
+                         "• `https://github.com/owner/repo/commit/sha`\n"
+                         "• Slack 링크: `<https://github.com/...>`\n"
+                         "• Markdown: `[text](https://github.com/...)`\n\n"
+                         "*예시:*\n"
+                         "```\n"
+                         "@x-commit https://github.com/owner/repo/commit/abc123\n"
+                         "```"
+                )
 
     def _analyze_and_post(self, commit, channel: str, thread_ts: str):
         """Analyze commit and post result to Slack.
@@ -320,11 +494,11 @@ class CommitAnalyzerBot:
             thread_ts: Thread timestamp to reply to
         """
         try:
-            # Post progress message
-            progress_response = self.slack_client.post_progress_message(
+            # Post the progress message in the background so its round
+            # trip overlaps the GitHub fetch instead of preceding it
+            progress_future = self.slack_client.submit_progress_message(
                 channel, thread_ts
             )
-            progress_ts = progress_response.get("ts")
 
             # Add reaction to original message
             try:
@@ -332,23 +506,124 @@ class CommitAnalyzerBot:
             except Exception as e:
                 logger.warning(f"Failed to add reaction: {e}")
 
-            # Analyze the commit
+            # Analyze the commit; concurrent duplicates coalesce inside
+            # CommitAnalyzer, so a re-posted commit URL only repeats the
+            # (ETag-revalidated) GitHub fetch
             logger.info(f"Analyzing commit {commit.sha[:8]}...")
             commit_info, file_changes = self.analyzer.github_client.get_commit(
                 commit.owner, commit.repo, commit.sha
             )
 
+            # The 'ts' is first needed for streaming updates below
+            progress_ts = None
+            try:
+                progress_ts = progress_future.result(timeout=10).get("ts")
+            except Exception as e:
+                logger.warning(f"Failed to post progress message: {e}")
+
+            # Stream partial output into the progress message
+            # (throttled) so the first tokens are visible at
+            # first-chunk latency
+            last_update = 0.0
+
+            def stream_to_slack(partial: str):
+                nonlocal last_update
+                now = time.monotonic()
+                if now - last_update < 0.8:
+                    return
+                last_update = now
+                try:
+                    self.slack_client.update_message(
+                        channel, progress_ts, partial
+                    )
+                except Exception as e:
+                    logger.debug(f"Failed to stream partial analysis: {e}")
+
             analysis = self.analyzer._analyze_commit(
-                commit_info, file_changes, "korean"
+                commit_info, file_changes, "korean",
+                on_text=stream_to_slack if progress_ts else None,
             )
 
             logger.info(f"Analysis completed for {commit.sha[:8]}")
 
-            # Update progress message with result
-            self.slack_client.post_analysis_result(
-                channel, thread_ts, commit_info, analysis, self.config.claude_model
+            # Edit the progress message into the final result: one
+            # chat.update instead of a second post plus a delete
+            if progress_ts:
+                self.slack_client.finalize_analysis(
+                    channel, progress_ts, commit_info, analysis,
+                    self.config.claude_model,
+                )
+            else:
+                self.slack_client.post_analysis_result(
+                    channel, thread_ts, commit_info, analysis,
+                    self.config.claude_model,
+                )
+
+            # Change reaction to check mark
+            try:
+                self.slack_client.remove_reaction(channel, thread_ts, "mag")
+                self.slack_client.add_reaction(
+                    channel, thread_ts, "white_check_mark"
+                )
+            except Exception as e:
+                logger.warning(f"Failed to update reaction: {e}")
+
+        except Exception as e:
+            logger.error(f"Failed to analyze commit: {e}", exc_info=True)
+
+            # Post error message
+            try:
+                error_msg = str(e)
+                if len(error_msg) > 200:
+                    error_msg = error_msg[:200] + "..."
+
+                self.slack_client.post_error_message(channel, thread_ts, error_msg)
+
+                # Update reaction to X
+                try:
+                    self.slack_client.remove_reaction(channel, thread_ts, "mag")
+                    self.slack_client.add_reaction(channel, thread_ts, "x")
+                except:
+                    pass
+
+            except Exception as post_error:
+                logger.error(f"Failed to post error message: {post_error}")
+
+    def _analyze_and_post_batch(self, commits, channel: str, thread_ts: str):
+        """Analyze several commits in one Claude call and post each result.
+
+        Args:
+            commits: List of ParsedCommit objects
+            channel: Slack channel ID
+            thread_ts: Thread timestamp to reply to
+        """
+        try:
+            # Post progress message
+            progress_response = self.slack_client.post_progress_message(
+                channel, thread_ts
+            )
+            progress_ts = progress_response.get("ts")
+
+            # Add reaction to original message
+            try:
+                self.slack_client.add_reaction(channel, thread_ts, "mag")
+            except Exception as e:
+                logger.warning(f"Failed to add reaction: {e}")
+
+            logger.info(f"Analyzing batch of {len(commits)} commits...")
+            results = self.analyzer.analyze_batch(
+                [(c.owner, c.repo, c.sha) for c in commits], "korean"
             )
 
+            logger.info(f"Batch analysis completed for {len(commits)} commits")
+
+            # Post one threaded reply per commit
+            for commit_info, analysis in results:
+                self.slack_client.post_analysis_result(
+                    channel, thread_ts, commit_info, analysis,
+                    self.config.claude_model
+                )
+
             # Remove progress message if it exists
             if progress_ts:
                 try:
@@ -360,9 +635,7 @@ class CommitAnalyzerBot:
 
             # Change reaction to check mark
             try:
-                self.slack_client.client.reactions_remove(
-                    channel=channel, timestamp=thread_ts, name="mag"
-                )
+                self.slack_client.remove_reaction(channel, thread_ts, "mag")
                 self.slack_client.add_reaction(
                     channel, thread_ts, "white_check_mark"
                 )
@@ -370,9 +643,8 @@ class CommitAnalyzerBot:
                 logger.warning(f"Failed to update reaction: {e}")
 
         except Exception as e:
-            logger.error(f"Failed to analyze commit: {e}", exc_info=True)
+            logger.error(f"Failed to analyze commit batch: {e}", exc_info=True)
 
-            # Post error message
             try:
                 error_msg = str(e)
                 if len(error_msg) > 200:
@@ -380,11 +652,8 @@ class CommitAnalyzerBot:
 
                 self.slack_client.post_error_message(channel, thread_ts, error_msg)
 
-                # Update reaction to X
                 try:
-                    self.slack_client.client.reactions_remove(
-                        channel=channel, timestamp=thread_ts, name="mag"
-                    )
+                    self.slack_client.remove_reaction(channel, thread_ts, "mag")
                     self.slack_client.add_reaction(channel, thread_ts, "x")
                 except:
                     pass
@@ -0,0 +1,154 @@
+"""Persistent cache for commit analysis results."""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Default location for the on-disk cache database
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "x-commit"
+
+# Default entry lifetime; 7 days keeps the database small while the
+# prompt or model may evolve underneath old entries
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+
+# Set by disable_cache() when the CLI passes --no-cache
+_disabled_override = False
+
+
+def disable_cache() -> None:
+    """Disable caching for the rest of this process."""
+    global _disabled_override
+    _disabled_override = True
+
+
+def is_cache_disabled() -> bool:
+    """Check whether caching is disabled (--no-cache or X_COMMIT_NO_CACHE)."""
+    if _disabled_override:
+        return True
+    return os.getenv("X_COMMIT_NO_CACHE", "").lower() in ("1", "true", "yes")
+
+
+def _ttl_from_env() -> Optional[int]:
+    """Read the TTL override from X_COMMIT_CACHE_TTL_DAYS, if set."""
+    days = os.getenv("X_COMMIT_CACHE_TTL_DAYS")
+    if days is None:
+        return None
+    try:
+        return int(float(days) * 24 * 3600)
+    except ValueError:
+        logger.warning(f"Invalid X_COMMIT_CACHE_TTL_DAYS value: {days!r}")
+        return None
+
+
+class AnalysisCache:
+    """SQLite-backed key/value cache for analysis results.
+
+    Entries expire after a TTL (default 7 days; X_COMMIT_CACHE_TTL_DAYS
+    overrides it, 0 keeps entries forever). Commit SHAs are immutable,
+    but the prompt and model are not, so a bounded lifetime keeps stale
+    analyses from outliving the code that produced them.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        ttl_seconds: Optional[int] = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            db_path: Path to the SQLite database file. If not provided,
+                uses ~/.cache/x-commit/analyses.db.
+            ttl_seconds: Entry lifetime in seconds. 0 disables expiry.
+                If not provided, uses X_COMMIT_CACHE_TTL_DAYS or the
+                7-day default.
+        """
+        if db_path is None:
+            db_path = DEFAULT_CACHE_DIR / "analyses.db"
+
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+
+        if ttl_seconds is None:
+            env_ttl = _ttl_from_env()
+            ttl_seconds = DEFAULT_TTL_SECONDS if env_ttl is None else env_ttl
+        self.ttl_seconds = ttl_seconds
+
+        # sqlite3 connections are not thread-safe by default; the bot calls
+        # into the cache from worker threads, so serialize access ourselves.
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS analysis_cache ("
+            "key TEXT PRIMARY KEY, "
+            "created_at INTEGER NOT NULL, "
+            "payload TEXT NOT NULL)"
+        )
+        self._conn.commit()
+        logger.info(f"Analysis cache initialized at {db_path}")
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up a cached analysis.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached analysis text, or None on miss
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, created_at FROM analysis_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            payload, created_at = row
+            if self.ttl_seconds and time.time() - created_at > self.ttl_seconds:
+                self._conn.execute(
+                    "DELETE FROM analysis_cache WHERE key = ?", (key,)
+                )
+                self._conn.commit()
+                return None
+
+        return payload
+
+    def set(self, key: str, payload: str) -> None:
+        """Store an analysis in the cache.
+
+        Args:
+            key: Cache key
+            payload: Analysis text to store
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO analysis_cache (key, created_at, payload) "
+                "VALUES (?, ?, ?)",
+                (key, int(time.time()), payload),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+# Global cache instance
+_cache: Optional[AnalysisCache] = None
+
+
+def get_analysis_cache() -> AnalysisCache:
+    """Get the global analysis cache instance."""
+    global _cache
+    if _cache is None:
+        _cache = AnalysisCache()
+    return _cache
@@ -1,14 +1,197 @@
 """Claude API client for analyzing commit changes."""
 
+import functools
 import logging
-from typing import Optional
+import re
+import threading
+from typing import Callable, Optional
 
-from anthropic import Anthropic
+from anthropic import Anthropic, AsyncAnthropic
 
+from . import http
 from .config import get_config
 
 logger = logging.getLogger(__name__)
 
+# Static analysis guidelines, passed as a cacheable system prompt.
+# Keeping these out of the per-commit user turn lets Anthropic's prompt
+# caching serve the instruction prefix on repeat calls.
+KOREAN_SYSTEM_PROMPT = """당신은 숙련된 코드 리뷰어입니다. 사용자가 제공하는 GitHub 커밋을 분석하여 팀원들이 이해하기 쉽게 한국어로 요약해주세요.
+
+## 분석 가이드라인
+
+**먼저 변경사항의 규모와 성격을 평가하세요:**
+
+1. **간단한 변경 (주석 추가, 포맷팅, 파일 삭제, 오타 수정, 로그 추가 등)**
+   - 1-2문장으로 간결하게 요약만 제공
+   - 예: "로그 메시지 추가 및 주석 개선"
+   - 섹션 구분 없이 핵심만 전달
+
+2. **중간 규모 변경 (작은 기능 추가, 버그 수정, 간단한 리팩토링)**
+   - 요약 (2-3문장)
+   - 주요 변경사항 (간단하게)
+   - 필요시 주의사항만 추가
+
+3. **중요한 변경 (새로운 기능, 아키텍처 변경, 중요한 버그 수정)**
+   - 요약 (3-4문장)
+   - 주요 변경사항 (상세)
+   - 기술적 세부사항
+   - 주의사항 및 Breaking changes
+   - 필요시 후속 작업 제안
+
+## 작성 원칙
+- **간단한 변경은 과도하게 분석하지 마세요** - 1-2문장이면 충분합니다
+- 코드의 의도를 파악하여 "무엇을" 했는지보다 "왜" 했는지를 설명하세요
+- 명확하고 간결하게 핵심만 전달하세요
+- 변경의 중요도에 비례하여 분석 분량을 조절하세요
+- 긍정적이고 건설적인 톤을 유지하세요
+"""
+
+ENGLISH_SYSTEM_PROMPT = """You are an experienced code reviewer. Analyze the GitHub commit provided by the user and provide a clear summary.
+
+## Analysis Guidelines
+
+**First, evaluate the scope and nature of the changes:**
+
+1. **Simple changes (comments, formatting, file deletion, typo fixes, logging, etc.)**
+   - Provide only a brief 1-2 sentence summary
+   - Example: "Added logging messages and improved comments"
+   - No section breakdown needed, just the essence
+
+2. **Medium changes (small feature additions, bug fixes, simple refactoring)**
+   - Summary (2-3 sentences)
+   - Key changes (brief)
+   - Cautions if necessary
+
+3. **Significant changes (new features, architecture changes, critical bug fixes)**
+   - Summary (3-4 sentences)
+   - Key changes (detailed)
+   - Technical details
+   - Cautions and breaking changes
+   - Follow-up suggestions if needed
+
+## Writing Principles
+- **Don't over-analyze simple changes** - 1-2 sentences is enough
+- Explain "why" rather than just "what"
+- Be clear and concise, focus on essentials
+- Scale analysis length proportionally to change importance
+- Maintain a positive and constructive tone
+"""
+
+# Opt-in header for prompt caching on older SDK/API versions.
+_PROMPT_CACHING_HEADERS = {"anthropic-beta": "prompt-caching-2024-07-31"}
+
+# Per-commit section headers in batch responses
+_BATCH_SECTION_PATTERN = re.compile(r"^##\s*Commit\s+\d+.*$", re.MULTILINE)
+
+# Per-commit metadata header; the diff travels as its own content block
+# (see _build_user_blocks) so it is never spliced into this template
+USER_META_TEMPLATE = """## 커밋 정보
+- **Repository**: {repository}
+- **Author**: {author}
+- **Commit Message**: {commit_message}
+
+## 변경사항 (Diff)
+```diff"""
+
+# Closes the fenced diff block opened by USER_META_TEMPLATE
+DIFF_FOOTER = "```"
+
+KOREAN_BATCH_INSTRUCTIONS = (
+    "다음 {count}개의 커밋을 각각 분석해주세요. "
+    '각 커밋의 분석 결과를 "## Commit N" 제목으로 구분하여 작성해주세요.'
+)
+
+ENGLISH_BATCH_INSTRUCTIONS = (
+    "Analyze each of the following {count} commits. "
+    'Separate the analysis for each commit under a "## Commit N" heading.'
+)
+
+
+@functools.lru_cache(maxsize=4)
+def _client_for(api_key: str) -> Anthropic:
+    """Get the process-wide Anthropic client for an API key.
+
+    Sharing the client (and the pooled httpx client underneath) reuses
+    TLS connections to api.anthropic.com across every ClaudeClient
+    instance. The SDK retries transient errors (429/5xx, timeouts) with
+    exponential backoff, so worker threads survive flaky calls.
+    """
+    return Anthropic(
+        api_key=api_key,
+        max_retries=3,
+        http_client=http.build_client(timeout=None),
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _async_client_for(api_key: str) -> AsyncAnthropic:
+    """Get the process-wide AsyncAnthropic client for an API key."""
+    return AsyncAnthropic(
+        api_key=api_key,
+        max_retries=3,
+        http_client=http.build_async_client(timeout=None),
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _request_semaphore() -> threading.BoundedSemaphore:
+    """Get the process-wide cap on simultaneous Claude API calls.
+
+    Without a gate, a burst of Slack events fans out into unbounded
+    concurrent requests and self-inflicted 429s. Saturated callers block
+    here instead; the SDK's own backoff handles any 429s that still get
+    through. Built lazily so importing this module never reads config.
+    """
+    return threading.BoundedSemaphore(get_config().max_concurrent_claude)
+
+
+def _system_blocks(language: str) -> list[dict]:
+    """Build the cacheable system content blocks for the given language."""
+    text = ENGLISH_SYSTEM_PROMPT if language == "english" else KOREAN_SYSTEM_PROMPT
+    return [
+        {
+            "type": "text",
+            "text": text,
+            "cache_control": {"type": "ephemeral"},
+        }
+    ]
+
+
+def _truncate_diff(diff: str, max_lines: int) -> str:
+    """Bound a diff to max_lines, keeping the head and tail halves.
+
+    Callers normally pre-trim (format_diff caps lines, the analyzer
+    trims to a token budget), but ClaudeClient is also usable directly,
+    so the input-size guard lives here as well.
+    """
+    lines = diff.splitlines()
+    if len(lines) <= max_lines:
+        return diff
+
+    keep = max_lines // 2
+    omitted = len(lines) - keep * 2
+    return "\n".join(
+        lines[:keep] + [f"... [truncated {omitted} lines] ..."] + lines[-keep:]
+    )
+
+
+def _user_blocks(user_content: "str | list[dict]") -> list[dict]:
+    """Build the user turn's content blocks with a cache breakpoint.
+
+    Accepts either pre-built text blocks or a plain string (wrapped in a
+    single block). The ephemeral marker goes on the last block: repeat
+    analyses of the same commit within the cache TTL (bot retries,
+    re-runs) reuse the tokenized diff on top of the always-cached
+    system rubric.
+    """
+    if isinstance(user_content, str):
+        blocks = [{"type": "text", "text": user_content}]
+    else:
+        blocks = [dict(block) for block in user_content]
+    blocks[-1]["cache_control"] = {"type": "ephemeral"}
+    return blocks
+
 
 class ClaudeClient:
     """Client for interacting with Claude API."""
@@ -23,108 +206,205 @@ class ClaudeClient:
         config = get_config()
         self.api_key = api_key or config.anthropic_api_key
         self.model = model or config.claude_model
-        self.client = Anthropic(api_key=self.api_key)
-        logger.info(f"Claude client initialized with model: {self.model}")
+        self.client = _client_for(self.api_key)
+        self.async_client = _async_client_for(self.api_key)
+        logger.info("Claude client initialized with model: %s", self.model)
 
-    def analyze_commit(
+    def _build_user_blocks(
+        self, commit_message: str, diff: str, repository: str, author: str
+    ) -> list[dict]:
+        """Build the per-commit user turn as separate content blocks.
+
+        Keeping the diff in its own block (instead of splicing it into an
+        f-string) avoids a second diff-sized allocation per request, which
+        matters for multi-MB diffs under the bot's concurrent load.
+        """
+        meta = USER_META_TEMPLATE.format(
+            repository=repository,
+            author=author,
+            commit_message=commit_message,
+        )
+        return [
+            {"type": "text", "text": meta},
+            {
+                "type": "text",
+                "text": _truncate_diff(diff, get_config().max_diff_lines),
+            },
+            {"type": "text", "text": DIFF_FOOTER},
+        ]
+
+    def _invoke(
         self,
-        commit_message: str,
-        diff: str,
-        repository: str,
-        author: str,
-        max_tokens: int = 4000,
+        language: str,
+        user_content: "str | list[dict]",
+        max_tokens: int,
+        on_text: Optional[Callable[[str], None]] = None,
     ) -> str:
-        """Analyze a commit using Claude.
+        """Send one analysis request to Claude and return the text.
+
+        Shared by every sync entry point: one request-build, error-log,
+        and usage-log path instead of a copy per language.
 
         Args:
-            commit_message: The commit message
-            diff: The diff content
-            repository: Repository name
-            author: Commit author
+            language: 'korean' or 'english'
+            user_content: Per-commit (or batch) user turn, as text or
+                pre-built content blocks
             max_tokens: Maximum tokens in response
+            on_text: Optional streaming callback
 
         Returns:
-            Analysis result as markdown text
+            The response text
         """
-        logger.info(f"Analyzing commit for {repository}")
+        try:
+            if on_text is not None:
+                return self._stream_response(
+                    _system_blocks(language), user_content, max_tokens, on_text
+                )
+
+            with _request_semaphore():
+                response = self.client.messages.create(
+                    model=self.model,
+                    max_tokens=max_tokens,
+                    system=_system_blocks(language),
+                    messages=[
+                        {
+                            "role": "user",
+                            "content": _user_blocks(user_content),
+                        }
+                    ],
+                    extra_headers=_PROMPT_CACHING_HEADERS,
+                )
 
-        prompt = self._build_analysis_prompt(
-            commit_message, diff, repository, author
-        )
+            analysis = response.content[0].text
+            self._log_usage(response.usage)
+
+            return analysis
+
+        except Exception as e:
+            logger.error("Failed to analyze commit with Claude: %s", e)
+            raise
 
+    async def _ainvoke(
+        self, language: str, user_content: "str | list[dict]", max_tokens: int
+    ) -> str:
+        """Send one analysis request to Claude (async version).
+
+        Args:
+            language: 'korean' or 'english'
+            user_content: Per-commit user turn, as text or content blocks
+            max_tokens: Maximum tokens in response
+
+        Returns:
+            The response text
+        """
         try:
-            response = self.client.messages.create(
+            response = await self.async_client.messages.create(
                 model=self.model,
                 max_tokens=max_tokens,
+                system=_system_blocks(language),
                 messages=[
                     {
                         "role": "user",
-                        "content": prompt,
+                        "content": _user_blocks(user_content),
                     }
                 ],
+                extra_headers=_PROMPT_CACHING_HEADERS,
             )
 
-            # Extract text from response
             analysis = response.content[0].text
-
-            # Log token usage
-            logger.info(
-                f"Claude API call completed. "
-                f"Input tokens: {response.usage.input_tokens}, "
-                f"Output tokens: {response.usage.output_tokens}"
-            )
+            self._log_usage(response.usage)
 
             return analysis
 
         except Exception as e:
-            logger.error(f"Failed to analyze commit with Claude: {e}")
+            logger.error("Failed to analyze commit with Claude: %s", e)
             raise
 
-    def _build_analysis_prompt(
-        self, commit_message: str, diff: str, repository: str, author: str
+    def _stream_response(
+        self,
+        system: list[dict],
+        user_content: "str | list[dict]",
+        max_tokens: int,
+        on_text: Callable[[str], None],
     ) -> str:
-        """Build the analysis prompt for Claude."""
-        prompt = f"""당신은 숙련된 코드 리뷰어입니다. 다음 GitHub 커밋을 분석하여 팀원들이 이해하기 쉽게 한국어로 요약해주세요.
-
-## 커밋 정보
-- **Repository**: {repository}
-- **Author**: {author}
-- **Commit Message**: {commit_message}
+        """Stream a response, forwarding accumulated text to a callback.
 
-## 변경사항 (Diff)
-```diff
-{diff}
-```
+        Streaming makes the first tokens available at first-chunk latency
+        instead of full-generation latency; callers can surface partial
+        output (e.g. via Slack chat_update) while Claude is still writing.
 
-## 분석 가이드라인
+        Args:
+            system: System content blocks
+            user_content: Per-commit user turn, as text or content blocks
+            max_tokens: Maximum tokens in response
+            on_text: Called with the accumulated text after each chunk
 
-**먼저 변경사항의 규모와 성격을 평가하세요:**
+        Returns:
+            The complete response text
+        """
+        buffer = ""
+        with _request_semaphore(), self.client.messages.stream(
+            model=self.model,
+            max_tokens=max_tokens,
+            system=system,
+            messages=[
+                {
+                    "role": "user",
+                    "content": _user_blocks(user_content),
+                }
+            ],
+            extra_headers=_PROMPT_CACHING_HEADERS,
+        ) as stream:
+            for text in stream.text_stream:
+                buffer += text
+                on_text(buffer)
+            message = stream.get_final_message()
+
+        self._log_usage(message.usage)
+        return message.content[0].text
+
+    def _log_usage(self, usage) -> None:
+        """Log token usage, including prompt-cache hit counters."""
+        cache_read = getattr(usage, "cache_read_input_tokens", None)
+        cache_creation = getattr(usage, "cache_creation_input_tokens", None)
+        logger.info(
+            "Claude API call completed. Input tokens: %s, Output tokens: %s, "
+            "Cache read tokens: %s, Cache creation tokens: %s",
+            usage.input_tokens,
+            usage.output_tokens,
+            cache_read,
+            cache_creation,
+        )
 
-1. **간단한 변경 (주석 추가, 포맷팅, 파일 삭제, 오타 수정, 로그 추가 등)**
-   - 1-2문장으로 간결하게 요약만 제공
-   - 예: "로그 메시지 추가 및 주석 개선"
-   - 섹션 구분 없이 핵심만 전달
+    def analyze_commit(
+        self,
+        commit_message: str,
+        diff: str,
+        repository: str,
+        author: str,
+        max_tokens: int = 4000,
+        on_text: Optional[Callable[[str], None]] = None,
+    ) -> str:
+        """Analyze a commit using Claude.
 
-2. **중간 규모 변경 (작은 기능 추가, 버그 수정, 간단한 리팩토링)**
-   - 요약 (2-3문장)
-   - 주요 변경사항 (간단하게)
-   - 필요시 주의사항만 추가
+        Args:
+            commit_message: The commit message
+            diff: The diff content
+            repository: Repository name
+            author: Commit author
+            max_tokens: Maximum tokens in response
+            on_text: Optional callback; when given, the response is
+                streamed and on_text receives the accumulated text
 
-3. **중요한 변경 (새로운 기능, 아키텍처 변경, 중요한 버그 수정)**
-   - 요약 (3-4문장)
-   - 주요 변경사항 (상세)
-   - 기술적 세부사항
-   - 주의사항 및 Breaking changes
-   - 필요시 후속 작업 제안
+        Returns:
+            Analysis result as markdown text
+        """
+        logger.info("Analyzing commit for %s", repository)
 
-## 작성 원칙
-- **간단한 변경은 과도하게 분석하지 마세요** - 1-2문장이면 충분합니다
-- 코드의 의도를 파악하여 "무엇을" 했는지보다 "왜" 했는지를 설명하세요
-- 명확하고 간결하게 핵심만 전달하세요
-- 변경의 중요도에 비례하여 분석 분량을 조절하세요
-- 긍정적이고 건설적인 톤을 유지하세요
-"""
-        return prompt
+        user_content = self._build_user_blocks(
+            commit_message, diff, repository, author
+        )
+        return self._invoke("korean", user_content, max_tokens, on_text)
 
     def analyze_commit_english(
         self,
@@ -133,6 +413,7 @@ class ClaudeClient:
         repository: str,
         author: str,
         max_tokens: int = 4000,
+        on_text: Optional[Callable[[str], None]] = None,
     ) -> str:
         """Analyze a commit using Claude (English version).
 
@@ -142,74 +423,139 @@ class ClaudeClient:
             repository: Repository name
             author: Commit author
             max_tokens: Maximum tokens in response
+            on_text: Optional callback; when given, the response is
+                streamed and on_text receives the accumulated text
 
         Returns:
             Analysis result as markdown text
         """
-        logger.info(f"Analyzing commit for {repository} (English)")
+        logger.info("Analyzing commit for %s (English)", repository)
 
-        prompt = f"""You are an experienced code reviewer. Analyze the following GitHub commit and provide a clear summary.
+        user_content = self._build_user_blocks(
+            commit_message, diff, repository, author
+        )
+        return self._invoke("english", user_content, max_tokens, on_text)
 
-## Commit Information
-- **Repository**: {repository}
-- **Author**: {author}
-- **Commit Message**: {commit_message}
+    def analyze_commits_batch(
+        self,
+        commits: list[dict],
+        language: str = "korean",
+        max_tokens: int = 8000,
+    ) -> list[str]:
+        """Analyze several commits in a single Claude request.
 
-## Changes (Diff)
-```diff
-{diff}
-```
+        Batching amortizes the cached system prompt across all commits and
+        replaces N API round-trips with one.
 
-## Analysis Guidelines
+        Args:
+            commits: List of dicts with keys commit_message, diff,
+                repository, and author (one per commit)
+            language: Language for analysis ('korean' or 'english')
+            max_tokens: Maximum tokens in response
 
-**First, evaluate the scope and nature of the changes:**
+        Returns:
+            List of per-commit analysis texts, in input order
+        """
+        lang = "english" if language.lower() == "english" else "korean"
+        count = len(commits)
+        logger.info("Analyzing batch of %d commits (%s)", count, lang)
+
+        if lang == "english":
+            instructions = ENGLISH_BATCH_INSTRUCTIONS.format(count=count)
+        else:
+            instructions = KOREAN_BATCH_INSTRUCTIONS.format(count=count)
+
+        # Per-commit diffs stay in their own content blocks here too, so a
+        # batch never concatenates every diff into one giant string
+        blocks: list[dict] = [{"type": "text", "text": instructions}]
+        for i, commit in enumerate(commits, 1):
+            commit_blocks = self._build_user_blocks(
+                commit["commit_message"],
+                commit["diff"],
+                commit["repository"],
+                commit["author"],
+            )
+            commit_blocks[0]["text"] = (
+                f"\n\n## Commit {i}\n\n" + commit_blocks[0]["text"]
+            )
+            blocks.extend(commit_blocks)
 
-1. **Simple changes (comments, formatting, file deletion, typo fixes, logging, etc.)**
-   - Provide only a brief 1-2 sentence summary
-   - Example: "Added logging messages and improved comments"
-   - No section breakdown needed, just the essence
+        text = self._invoke(lang, blocks, max_tokens)
+        return self._split_batch_response(text, count)
 
-2. **Medium changes (small feature additions, bug fixes, simple refactoring)**
-   - Summary (2-3 sentences)
-   - Key changes (brief)
-   - Cautions if necessary
+    def _split_batch_response(self, text: str, count: int) -> list[str]:
+        """Split a batch response into per-commit sections.
 
-3. **Significant changes (new features, architecture changes, critical bug fixes)**
-   - Summary (3-4 sentences)
-   - Key changes (detailed)
-   - Technical details
-   - Cautions and breaking changes
-   - Follow-up suggestions if needed
+        Falls back to returning the full text for every commit if the
+        expected section headers are missing.
+        """
+        matches = list(_BATCH_SECTION_PATTERN.finditer(text))
+        if len(matches) != count:
+            logger.warning(
+                "Expected %d commit sections in batch response, found %d; "
+                "returning full text per commit",
+                count,
+                len(matches),
+            )
+            return [text] * count
 
-## Writing Principles
-- **Don't over-analyze simple changes** - 1-2 sentences is enough
-- Explain "why" rather than just "what"
-- Be clear and concise, focus on essentials
-- Scale analysis length proportionally to change importance
-- Maintain a positive and constructive tone
-"""
+        sections = []
+        for i, match in enumerate(matches):
+            start = match.end()
+            end = matches[i + 1].start() if i + 1 < count else len(text)
+            sections.append(text[start:end].strip())
+        return sections
 
-        try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=max_tokens,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt,
-                    }
-                ],
-            )
+    async def aanalyze_commit(
+        self,
+        commit_message: str,
+        diff: str,
+        repository: str,
+        author: str,
+        max_tokens: int = 4000,
+    ) -> str:
+        """Analyze a commit using Claude (async version).
 
-            analysis = response.content[0].text
-            logger.info(
-                f"Claude API call completed. "
-                f"Input tokens: {response.usage.input_tokens}, "
-                f"Output tokens: {response.usage.output_tokens}"
-            )
+        Args:
+            commit_message: The commit message
+            diff: The diff content
+            repository: Repository name
+            author: Commit author
+            max_tokens: Maximum tokens in response
 
-            return analysis
+        Returns:
+            Analysis result as markdown text
+        """
+        logger.info("Analyzing commit for %s (async)", repository)
 
-        except Exception as e:
-            logger.error(f"Failed to analyze commit with Claude: {e}")
-            raise
+        user_content = self._build_user_blocks(
+            commit_message, diff, repository, author
+        )
+        return await self._ainvoke("korean", user_content, max_tokens)
+
+    async def aanalyze_commit_english(
+        self,
+        commit_message: str,
+        diff: str,
+        repository: str,
+        author: str,
+        max_tokens: int = 4000,
+    ) -> str:
+        """Analyze a commit using Claude (async English version).
+
+        Args:
+            commit_message: The commit message
+            diff: The diff content
+            repository: Repository name
+            author: Commit author
+            max_tokens: Maximum tokens in response
+
+        Returns:
+            Analysis result as markdown text
+        """
+        logger.info("Analyzing commit for %s (async, English)", repository)
+
+        user_content = self._build_user_blocks(
+            commit_message, diff, repository, author
+        )
+        return await self._ainvoke("english", user_content, max_tokens)
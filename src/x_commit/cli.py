@@ -1,28 +1,64 @@
 """Command-line interface for x-commit."""
 
+import functools
 import logging
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 import click
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from .analyzer import CommitAnalyzer
-from .config import get_config
-from .formatter import ConsoleFormatter
+logger = logging.getLogger(__name__)
 
-# Configure console with force_terminal and legacy_windows settings for better Windows compatibility
-console = Console(force_terminal=True, legacy_windows=False)
+# rich, the analyzer, and their transitive dependencies (anthropic,
+# httpx, slack_bolt, ...) are imported inside the subcommands that need
+# them, so `x-commit version`/`--help`/`parse-message` start instantly
+
+
+@functools.cache
+def _console():
+    """Create the shared rich console on first use."""
+    from rich.console import Console
+
+    # Configure console with force_terminal and legacy_windows settings for better Windows compatibility
+    return Console(force_terminal=True, legacy_windows=False)
+
+
+@functools.cache
+def _parser():
+    """Create the shared MessageParser on first use."""
+    from .message_parser import MessageParser
+
+    return MessageParser()
 
 
 def setup_logging(level: str = "INFO"):
-    """Setup logging configuration."""
+    """Setup logging configuration.
+
+    Records go through a queue to a listener thread, so emitting a log
+    line on a hot path (e.g. per Slack API call) never blocks on
+    handler I/O.
+    """
+    import atexit
+    import queue
+    from logging.handlers import QueueHandler, QueueListener
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    listener = QueueListener(
+        log_queue, logging.StreamHandler(), respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+    handler = QueueHandler(log_queue)
+    handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    )
     logging.basicConfig(
         level=getattr(logging, level.upper()),
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[logging.StreamHandler()],
+        handlers=[handler],
     )
 
 
@@ -33,12 +69,38 @@ def setup_logging(level: str = "INFO"):
     default="INFO",
     help="Set logging level",
 )
-def cli(log_level: str):
+@click.pass_context
+def cli(ctx: click.Context, log_level: str):
     """X-Commit: GitHub commit analyzer with Claude AI.
 
     Analyze GitHub commits and generate detailed reports using Claude AI.
     """
     setup_logging(log_level)
+    ctx.ensure_object(dict)
+
+
+def _require_config(ctx: click.Context):
+    """Load the shared Config once per invocation, exiting on failure.
+
+    Subcommands that need credentials call this instead of repeating
+    their own get_config() try/except; commands like version and
+    parse-message never touch it, so they keep working without a .env.
+    """
+    obj = ctx.ensure_object(dict)
+    if "config" not in obj:
+        from .config import get_config
+        from .formatter import ConsoleFormatter
+
+        try:
+            obj["config"] = get_config()
+        except ValueError as e:
+            console = _console()
+            console.print(f"[red]{ConsoleFormatter.format_error(str(e))}[/red]")
+            console.print(
+                "\n[yellow]Hint: Copy .env.example to .env and fill in your API keys.[/yellow]"
+            )
+            sys.exit(1)
+    return obj["config"]
 
 
 @cli.command()
@@ -57,20 +119,30 @@ def cli(log_level: str):
 @click.option(
     "-l",
     "--language",
-    type=click.Choice(["korean", "english", "ko", "en"], case_sensitive=False),
+    type=click.Choice(
+        ["korean", "english", "ko", "en", "both"], case_sensitive=False
+    ),
     default="korean",
-    help="Analysis language (default: korean)",
+    help="Analysis language (default: korean; 'both' runs Korean and English in parallel)",
 )
 @click.option(
     "--repo",
     help="Repository in format 'owner/repo' (required if COMMIT is a SHA)",
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Skip the analysis cache and always call Claude",
+)
+@click.pass_context
 def analyze(
+    ctx: click.Context,
     commit: str,
     output: Optional[Path],
     stdout: bool,
     language: str,
     repo: Optional[str],
+    no_cache: bool,
 ):
     """Analyze a GitHub commit.
 
@@ -92,18 +164,29 @@ def analyze(
       # Analyze in English
       x-commit analyze https://github.com/owner/repo/commit/abc123 --language english
     """
-    try:
-        config = get_config()
-    except ValueError as e:
-        console.print(f"[red]{ConsoleFormatter.format_error(str(e))}[/red]")
-        console.print("\n[yellow]Hint: Copy .env.example to .env and fill in your API keys.[/yellow]")
-        sys.exit(1)
+    from rich.progress import Progress, SpinnerColumn, TextColumn
 
-    # Normalize language
-    lang = "english" if language.lower() in ["english", "en"] else "korean"
+    from .analyzer import get_analyzer
+    from .formatter import ConsoleFormatter
+
+    console = _console()
+    config = _require_config(ctx)
+
+    if no_cache:
+        from .cache import disable_cache
+
+        disable_cache()
+
+    # Normalize language; 'both' analyzes Korean and English concurrently
+    if language.lower() == "both":
+        langs = ["korean", "english"]
+    elif language.lower() in ["english", "en"]:
+        langs = ["english"]
+    else:
+        langs = ["korean"]
 
     # Determine if commit is a URL or SHA
-    is_url = commit.startswith("http://") or commit.startswith("https://")
+    is_url = commit.startswith(("http://", "https://"))
 
     if not is_url and not repo:
         # Check if default repo is configured
@@ -129,11 +212,12 @@ def analyze(
     ) as progress:
         # Create analyzer
         task = progress.add_task("Initializing...", total=None)
-        analyzer = CommitAnalyzer()
+        analyzer = get_analyzer()
 
         # Fetch and analyze commit
         try:
             progress.update(task, description="Fetching commit from GitHub...")
+            stage_start = time.perf_counter()
 
             if is_url:
                 commit_info, file_changes = analyzer.github_client.get_commit_by_url(
@@ -145,6 +229,10 @@ def analyze(
                     owner, repo_name, commit
                 )
 
+            logger.debug(
+                "Stage timing: fetch %.2fs", time.perf_counter() - stage_start
+            )
+
             console.print(
                 f"\n[green]{ConsoleFormatter.format_success('Commit fetched successfully')}[/green]"
             )
@@ -157,39 +245,90 @@ def analyze(
             )
 
             progress.update(task, description="Analyzing with Claude AI...")
-            analysis = analyzer._analyze_commit(commit_info, file_changes, lang)
+            stage_start = time.perf_counter()
+
+            # With --stdout and a single language, print tokens as they
+            # arrive instead of waiting for the full response
+            stream_cb = None
+            if stdout and len(langs) == 1:
+                progress.stop()
+                console.print("\n[bold]Streaming analysis:[/bold]\n")
+                printed = 0
+
+                def stream_cb(accumulated: str):
+                    nonlocal printed
+                    print(accumulated[printed:], end="", flush=True)
+                    printed = len(accumulated)
+
+            if len(langs) > 1:
+                # Claude calls are network-bound, so both languages run
+                # concurrently on the shared client
+                with ThreadPoolExecutor(max_workers=len(langs)) as pool:
+                    analyses = list(
+                        pool.map(
+                            lambda l: analyzer._analyze_commit(
+                                commit_info, file_changes, l
+                            ),
+                            langs,
+                        )
+                    )
+            else:
+                analyses = [
+                    analyzer._analyze_commit(
+                        commit_info, file_changes, langs[0], on_text=stream_cb
+                    )
+                ]
+                if stream_cb is not None:
+                    print(flush=True)
+
+            logger.debug(
+                "Stage timing: analysis %.2fs", time.perf_counter() - stage_start
+            )
 
             console.print(
                 f"[green]{ConsoleFormatter.format_success('Analysis completed')}[/green]"
             )
 
-            # Generate report
+            # Generate report(s)
             progress.update(task, description="Generating report...")
 
-            if stdout:
-                # Print to stdout
-                report = analyzer.generate_report(
-                    commit_info, file_changes, analysis, None
-                )
-                console.print("\n" + "=" * 80)
-                console.print(report)
-                console.print("=" * 80)
-            else:
-                # Save to file
-                if not output:
-                    # Auto-generate filename
-                    timestamp = commit_info.date.strftime("%Y%m%d_%H%M%S")
-                    filename = f"{commit_info.repository.replace('/', '_')}_{commit_info.sha[:8]}_{timestamp}.md"
-                    output = config.output_dir / filename
-
-                report = analyzer.generate_report(
-                    commit_info, file_changes, analysis, output
-                )
-
-                console.print(
-                    f"\n[green]{ConsoleFormatter.format_success('Report saved successfully')}[/green]"
-                )
-                console.print(f"  Location: {output.absolute()}")
+            for lang, analysis in zip(langs, analyses):
+                if stdout:
+                    # Print to stdout
+                    report = analyzer.generate_report(
+                        commit_info, file_changes, analysis, None
+                    )
+                    console.print("\n" + "=" * 80)
+                    if len(langs) > 1:
+                        console.print(f"[bold]Language: {lang}[/bold]")
+                    console.print(report)
+                    console.print("=" * 80)
+                else:
+                    # Save to file
+                    if output:
+                        out_path = output
+                        if len(langs) > 1:
+                            out_path = output.with_name(
+                                f"{output.stem}_{lang}{output.suffix}"
+                            )
+                    else:
+                        # Auto-generate filename
+                        timestamp = commit_info.date.strftime("%Y%m%d_%H%M%S")
+                        suffix = f"_{lang}" if len(langs) > 1 else ""
+                        filename = (
+                            f"{commit_info.repository.replace('/', '_')}_"
+                            f"{commit_info.sha[:8]}_{timestamp}{suffix}.md"
+                        )
+                        out_path = config.output_dir / filename
+
+                    report = analyzer.generate_report(
+                        commit_info, file_changes, analysis, out_path
+                    )
+
+                    console.print(
+                        f"\n[green]{ConsoleFormatter.format_success('Report saved successfully')}[/green]"
+                    )
+                    console.print(f"  Location: {out_path.absolute()}")
 
         except ValueError as e:
             progress.stop()
@@ -204,11 +343,69 @@ def analyze(
             sys.exit(1)
 
 
+@cli.command(name="analyze-batch")
+@click.argument("message")
+@click.option(
+    "-l",
+    "--language",
+    type=click.Choice(["korean", "english", "ko", "en"], case_sensitive=False),
+    default="korean",
+    help="Analysis language (default: korean)",
+)
+@click.pass_context
+def analyze_batch(ctx: click.Context, message: str, language: str):
+    """Analyze every commit referenced in MESSAGE concurrently.
+
+    MESSAGE is parsed like parse-message --all; each commit found is
+    fetched and analyzed on its own worker thread, so N commits take
+    roughly as long as the slowest one instead of the sum.
+
+    Examples:
+
+      # Analyze both commits from a push notification
+      x-commit analyze-batch "rick pushed to main: url1 - Fix bug url2"
+    """
+    from .analyzer import get_analyzer
+
+    console = _console()
+    config = _require_config(ctx)
+
+    lang = "english" if language.lower() in ["english", "en"] else "korean"
+
+    commits = _parser().extract_all_commits(message)
+    if not commits:
+        console.print("[yellow]No GitHub commit URLs found in the message.[/yellow]")
+        sys.exit(1)
+
+    console.print(f"[green]Found {len(commits)} commit(s), analyzing...[/green]\n")
+
+    analyzer = get_analyzer()
+    max_workers = min(len(commits), config.max_concurrent_analyses, 8)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = list(
+            pool.map(
+                lambda c: analyzer.analyze_by_sha(c.owner, c.repo, c.sha, lang),
+                commits,
+            )
+        )
+
+    for commit_info, analysis in results:
+        console.print("=" * 80)
+        console.print(
+            f"[bold]{commit_info.repository}@{commit_info.sha[:8]}[/bold] "
+            f"by {commit_info.author_name}"
+        )
+        console.print("=" * 80)
+        console.print(analysis)
+        console.print()
+
+
 @cli.command()
 def version():
     """Show version information."""
     from . import __version__
-    console.print(f"x-commit version {__version__}")
+    _console().print(f"x-commit version {__version__}")
 
 
 @cli.command()
@@ -241,9 +438,8 @@ def parse_message(message: str, all: bool):
       # Extract all commits from a message
       x-commit parse-message "See commits: url1 and url2" --all
     """
-    from .message_parser import MessageParser
-
-    parser = MessageParser()
+    console = _console()
+    parser = _parser()
 
     if all:
         # Extract all commits
@@ -310,7 +506,14 @@ def parse_message(message: str, all: bool):
     default=3000,
     help="Port for HTTP mode (default: 3000)",
 )
-def serve(mode: str, port: int):
+@click.option(
+    "--max-concurrent-claude",
+    type=int,
+    default=None,
+    help="Cap on simultaneous Claude API calls (default: MAX_CONCURRENT_CLAUDE or 4)",
+)
+@click.pass_context
+def serve(ctx, mode: str, port: int, max_concurrent_claude: Optional[int]):
     """Start the Slack bot server.
 
     The bot will listen for GitHub commit messages in Slack and automatically
@@ -328,11 +531,12 @@ def serve(mode: str, port: int):
       # Start HTTP server for production
       x-commit serve --mode http --port 3000
     """
-    try:
-        config = get_config()
-    except ValueError as e:
-        console.print(f"[red]{ConsoleFormatter.format_error(str(e))}[/red]")
-        sys.exit(1)
+    console = _console()
+    config = _require_config(ctx)
+
+    # Must happen before the first Claude call creates the semaphore
+    if max_concurrent_claude is not None:
+        config.max_concurrent_claude = max_concurrent_claude
 
     # Check Slack configuration
     if not config.slack_bot_token:
@@ -422,67 +626,68 @@ def serve(mode: str, port: int):
 
 
 @cli.command()
-def config_check():
+@click.pass_context
+def config_check(ctx):
     """Check configuration and verify API credentials."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    console = _console()
     console.print("[bold]Checking configuration...[/bold]\n")
 
-    try:
-        config = get_config()
-        console.print("[green][OK] Configuration loaded successfully[/green]")
+    config = _require_config(ctx)
+    console.print("[green][OK] Configuration loaded successfully[/green]")
 
-        # Check GitHub token
-        console.print("\n[bold]GitHub API:[/bold]")
-        console.print(f"  Token: {'[OK]' if config.github_token else '[X]'} {'Set' if config.github_token else 'Not set'}")
-        if config.github_default_repo:
-            console.print(f"  Default repo: {config.github_default_repo}")
-
-        # Check Claude API
-        console.print("\n[bold]Claude API:[/bold]")
-        console.print(f"  API Key: {'[OK]' if config.anthropic_api_key else '[X]'} {'Set' if config.anthropic_api_key else 'Not set'}")
-        console.print(f"  Model: {config.claude_model}")
-
-        # Check output directory
-        console.print("\n[bold]Application:[/bold]")
-        console.print(f"  Output directory: {config.output_dir}")
-        console.print(f"  Log level: {config.log_level}")
-        console.print(f"  Max diff lines: {config.max_diff_lines}")
-
-        # Test API connections
-        console.print("\n[bold]Testing API connections...[/bold]")
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Testing GitHub API...", total=None)
-
-            try:
-                from .github_client import GitHubClient
-
-                github_client = GitHubClient()
-                user = github_client.client.get_user()
-                console.print(f"[green]  [OK] GitHub API: Connected as {user.login}[/green]")
-            except Exception as e:
-                console.print(f"[red]  [X] GitHub API: Failed - {e}[/red]")
-
-            progress.update(task, description="Testing Claude API...")
-
-            try:
-                from .claude_client import ClaudeClient
-
-                claude_client = ClaudeClient()
-                # Just check if client initializes
-                console.print(f"[green]  [OK] Claude API: Initialized[/green]")
-            except Exception as e:
-                console.print(f"[red]  [X] Claude API: Failed - {e}[/red]")
-
-        console.print("\n[green]Configuration check complete![/green]")
-
-    except ValueError as e:
-        console.print(f"[red][ERROR] Configuration error: {e}[/red]")
-        console.print("\n[yellow]Hint: Copy .env.example to .env and fill in your API keys.[/yellow]")
-        sys.exit(1)
+    # Check GitHub token
+    console.print("\n[bold]GitHub API:[/bold]")
+    console.print(f"  Token: {'[OK]' if config.github_token else '[X]'} {'Set' if config.github_token else 'Not set'}")
+    if config.github_default_repo:
+        console.print(f"  Default repo: {config.github_default_repo}")
+
+    # Check Claude API
+    console.print("\n[bold]Claude API:[/bold]")
+    console.print(f"  API Key: {'[OK]' if config.anthropic_api_key else '[X]'} {'Set' if config.anthropic_api_key else 'Not set'}")
+    console.print(f"  Model: {config.claude_model}")
+
+    # Check output directory
+    console.print("\n[bold]Application:[/bold]")
+    console.print(f"  Output directory: {config.output_dir}")
+    console.print(f"  Log level: {config.log_level}")
+    console.print(f"  Max diff lines: {config.max_diff_lines}")
+
+    # Test API connections
+    console.print("\n[bold]Testing API connections...[/bold]")
+
+    from .claude_client import ClaudeClient
+    from .github_client import GitHubClient
+
+    def _probe_github() -> str:
+        user = GitHubClient().client.get_user()
+        return f"GitHub API: Connected as {user.login}"
+
+    def _probe_claude() -> str:
+        ClaudeClient()  # Just check if client initializes
+        return "Claude API: Initialized"
+
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+    ) as progress:
+        progress.add_task("Testing GitHub + Claude APIs...", total=None)
+
+        # Both probes are pure I/O, so run them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = {
+                "GitHub API": executor.submit(_probe_github),
+                "Claude API": executor.submit(_probe_claude),
+            }
+            for name, future in futures.items():
+                try:
+                    console.print(f"[green]  [OK] {future.result()}[/green]")
+                except Exception as e:
+                    console.print(f"[red]  [X] {name}: Failed - {e}[/red]")
+
+    console.print("\n[green]Configuration check complete![/green]")
 
 
 def main():
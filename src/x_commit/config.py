@@ -1,5 +1,6 @@
 """Configuration management for x-commit."""
 
+import functools
 import os
 from dataclasses import dataclass
 from pathlib import Path
@@ -7,9 +8,6 @@ from typing import Optional
 
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
-
 
 @dataclass
 class Config:
@@ -20,6 +18,7 @@ class Config:
     anthropic_api_key: str
 
     # Optional settings
+    github_tokens: Optional[list[str]] = None  # Extra tokens rotated per request
     github_default_repo: Optional[str] = None
     claude_model: str = "claude-sonnet-4-5-20250929"
 
@@ -35,11 +34,18 @@ class Config:
     log_level: str = "INFO"
     output_dir: Path = Path("./reports")
     max_diff_lines: int = 1000
+    max_diff_tokens: int = 12000  # Approximate token budget for diffs sent to Claude
     ignore_file_path: Path = Path(".xcommitignore")  # Path to ignore patterns file
+    max_concurrent_analyses: int = 4  # Worker pool size for Slack bot analyses
+    max_concurrent_claude: int = 4  # Cap on simultaneous Claude API calls
 
     @classmethod
     def from_env(cls) -> "Config":
         """Load configuration from environment variables."""
+        # Load .env here rather than at import time, so merely importing
+        # this module doesn't touch the filesystem
+        load_dotenv()
+
         github_token = os.getenv("GITHUB_TOKEN")
         if not github_token:
             raise ValueError(
@@ -55,7 +61,14 @@ class Config:
             )
 
         output_dir = Path(os.getenv("OUTPUT_DIR", "./reports"))
-        output_dir.mkdir(parents=True, exist_ok=True)
+        if not output_dir.exists():
+            output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Parse extra GitHub tokens (comma-separated list)
+        github_tokens = None
+        tokens_env = os.getenv("GITHUB_TOKENS")
+        if tokens_env:
+            github_tokens = [t.strip() for t in tokens_env.split(",") if t.strip()]
 
         # Parse target branches (comma-separated list)
         target_branches = None
@@ -66,6 +79,7 @@ class Config:
         return cls(
             github_token=github_token,
             anthropic_api_key=anthropic_api_key,
+            github_tokens=github_tokens,
             github_default_repo=os.getenv("GITHUB_DEFAULT_REPO"),
             claude_model=os.getenv("CLAUDE_MODEL", "claude-sonnet-4-5-20250929"),
             slack_bot_token=os.getenv("SLACK_BOT_TOKEN"),
@@ -77,17 +91,14 @@ class Config:
             log_level=os.getenv("LOG_LEVEL", "INFO"),
             output_dir=output_dir,
             max_diff_lines=int(os.getenv("MAX_DIFF_LINES", "1000")),
+            max_diff_tokens=int(os.getenv("MAX_DIFF_TOKENS", "12000")),
             ignore_file_path=Path(os.getenv("XCOMMIT_IGNORE_FILE", ".xcommitignore")),
+            max_concurrent_analyses=int(os.getenv("MAX_CONCURRENT_ANALYSES", "4")),
+            max_concurrent_claude=int(os.getenv("MAX_CONCURRENT_CLAUDE", "4")),
         )
 
 
-# Global config instance
-_config: Optional[Config] = None
-
-
+@functools.lru_cache(maxsize=1)
 def get_config() -> Config:
-    """Get the global configuration instance."""
-    global _config
-    if _config is None:
-        _config = Config.from_env()
-    return _config
+    """Get the global configuration instance (built once per process)."""
+    return Config.from_env()
@@ -1,11 +1,32 @@
 """Formatters for output generation."""
 
+import functools
+import io
 from datetime import datetime
 from typing import List
 
 from .github_client import CommitInfo, FileChange
 
 
+@functools.lru_cache(maxsize=1024)
+def _fmt_dt(dt: datetime) -> str:
+    """Format a datetime for display, caching repeated values.
+
+    strftime re-parses its format string on every call; the same commit
+    date is formatted several times per report, so memoizing it pays.
+    """
+    return dt.strftime('%Y-%m-%d %H:%M:%S')
+
+
+# Per-status emoji for file change lists
+_STATUS_EMOJI = {
+    "added": "✨",
+    "removed": "🗑️",
+    "modified": "✏️",
+    "renamed": "📝",
+}
+
+
 class MarkdownFormatter:
     """Formatter for generating Markdown reports."""
 
@@ -29,7 +50,7 @@ class MarkdownFormatter:
         Returns:
             Formatted Markdown report
         """
-        report_parts = [
+        header_block = "\n".join((
             "# 커밋 분석 리포트",
             "",
             "## 📋 커밋 정보",
@@ -37,7 +58,7 @@ class MarkdownFormatter:
             f"- **Repository**: [{commit_info.repository}](https://github.com/{commit_info.repository})",
             f"- **Commit**: [`{commit_info.sha[:8]}`]({commit_info.url})",
             f"- **Author**: {commit_info.author_name} <{commit_info.author_email}>",
-            f"- **Date**: {commit_info.date.strftime('%Y-%m-%d %H:%M:%S')}",
+            f"- **Date**: {_fmt_dt(commit_info.date)}",
             f"- **Files Changed**: {commit_info.files_changed} files (+{commit_info.additions} -{commit_info.deletions})",
             "",
             "### 커밋 메시지",
@@ -55,34 +76,27 @@ class MarkdownFormatter:
             "",
             "## 📁 변경된 파일 목록",
             "",
-        ]
-
-        # Add file changes summary
-        for change in file_changes:
-            status_emoji = {
-                "added": "✨",
-                "removed": "🗑️",
-                "modified": "✏️",
-                "renamed": "📝",
-            }.get(change.status, "📄")
-
-            report_parts.append(
-                f"- {status_emoji} **{change.filename}** ({change.status}): "
-                f"+{change.additions} -{change.deletions}"
-            )
-
-        report_parts.extend(
-            [
-                "",
-                "---",
-                "",
-                f"*분석 일시: {analysis_time.strftime('%Y-%m-%d %H:%M:%S')}*  ",
-                f"*분석 모델: {model}*  ",
-                f"*생성: [x-commit](https://github.com/caveduck/x-commit)*",
-            ]
+        ))
+
+        # File changes summary as one join over a generator: no
+        # intermediate list growth for commits touching many files
+        files_block = "\n".join(
+            f"- {_STATUS_EMOJI.get(change.status, '📄')} "
+            f"**{change.filename}** ({change.status}): "
+            f"+{change.additions} -{change.deletions}"
+            for change in file_changes
         )
 
-        return "\n".join(report_parts)
+        footer_block = "\n".join((
+            "",
+            "---",
+            "",
+            f"*분석 일시: {_fmt_dt(analysis_time)}*  ",
+            f"*분석 모델: {model}*  ",
+            f"*생성: [x-commit](https://github.com/caveduck/x-commit)*",
+        ))
+
+        return "\n".join((header_block, files_block, footer_block))
 
     @staticmethod
     def format_slack_message(
@@ -102,7 +116,7 @@ class MarkdownFormatter:
         max_length = 39000
         truncated = False
 
-        message_parts = [
+        header = "\n".join((
             f"*🔍 커밋 분석 완료*",
             "",
             f"*Repository:* <https://github.com/{commit_info.repository}|{commit_info.repository}>",
@@ -112,24 +126,77 @@ class MarkdownFormatter:
             "",
             "---",
             "",
-            analysis,
-        ]
-
-        message = "\n".join(message_parts)
-
-        # Truncate if too long
-        if len(message) > max_length:
-            message = message[:max_length] + "\n\n...(메시지가 너무 길어 생략되었습니다)"
+        ))
+
+        # Write into a buffer with a running length so an over-long
+        # analysis is sliced once to exactly fit, instead of building
+        # the full message and re-copying it to truncate
+        buf = io.StringIO()
+        buf.write(header)
+        buf.write("\n")
+        written = len(header) + 1
+
+        if written + len(analysis) > max_length:
+            buf.write(analysis[:max_length - written])
+            buf.write("\n\n...(메시지가 너무 길어 생략되었습니다)")
             truncated = True
+        else:
+            buf.write(analysis)
 
         # Add footer
-        footer = f"\n\n_분석 모델: {model}_"
+        buf.write(f"\n\n_분석 모델: {model}_")
         if truncated:
-            footer += " | _일부 내용이 생략되었습니다_"
+            buf.write(" | _일부 내용이 생략되었습니다_")
+
+        return buf.getvalue()
+
+    @staticmethod
+    def format_slack_blocks(
+        commit_info: CommitInfo, analysis: str, model: str
+    ) -> list:
+        """Format analysis as Slack Block Kit blocks.
+
+        Sending structured blocks skips Slack's server-side markdown
+        parsing of one large text body. The analysis is split across
+        section blocks to respect the 3000-character section limit.
+
+        Args:
+            commit_info: Commit information
+            analysis: Claude's analysis text
+            model: Claude model used
+
+        Returns:
+            List of Block Kit block dicts
+        """
+        # Slack caps mrkdwn section text at 3000 characters
+        section_limit = 3000
+
+        header_text = "\n".join((
+            f"*🔍 커밋 분석 완료*",
+            "",
+            f"*Repository:* <https://github.com/{commit_info.repository}|{commit_info.repository}>",
+            f"*Commit:* <{commit_info.url}|`{commit_info.sha[:8]}`>",
+            f"*Author:* {commit_info.author_name}",
+            f"*Changes:* {commit_info.files_changed} files (+{commit_info.additions} -{commit_info.deletions})",
+        ))
 
-        message += footer
+        blocks = [
+            {"type": "section", "text": {"type": "mrkdwn", "text": header_text}},
+            {"type": "divider"},
+        ]
+
+        for start in range(0, len(analysis), section_limit):
+            blocks.append({
+                "type": "section",
+                "text": {"type": "mrkdwn", "text": analysis[start:start + section_limit]},
+            })
+
+        blocks.append({
+            "type": "context",
+            "elements": [{"type": "mrkdwn", "text": f"_분석 모델: {model}_"}],
+        })
 
-        return message
+        return blocks
 
     @staticmethod
     def format_short_summary(commit_info: CommitInfo, file_changes: List[FileChange]) -> str:
@@ -145,7 +212,7 @@ class MarkdownFormatter:
         summary_parts = [
             f"Commit: {commit_info.sha[:8]}",
             f"Author: {commit_info.author_name}",
-            f"Date: {commit_info.date.strftime('%Y-%m-%d %H:%M:%S')}",
+            f"Date: {_fmt_dt(commit_info.date)}",
             f"Changes: {commit_info.files_changed} files (+{commit_info.additions} -{commit_info.deletions})",
             "",
             "Message:",
@@ -154,8 +221,13 @@ class MarkdownFormatter:
             "Files:",
         ]
 
-        for change in file_changes[:10]:  # Limit to 10 files
-            summary_parts.append(f"  - {change.filename} ({change.status})")
+        # Limit to 10 files
+        summary_parts.append(
+            "\n".join(
+                f"  - {change.filename} ({change.status})"
+                for change in file_changes[:10]
+            )
+        )
 
         if len(file_changes) > 10:
             summary_parts.append(f"  ... and {len(file_changes) - 10} more files")
@@ -166,62 +238,52 @@ class MarkdownFormatter:
 class ConsoleFormatter:
     """Formatter for console output with colors."""
 
-    @staticmethod
-    def format_progress(message: str) -> str:
-        """Format a progress message for console output.
-
-        Args:
-            message: Progress message
+    # Precomputed level prefixes (and optional suffix) for format()
+    _PREFIX = {
+        "progress": "[*] ",
+        "success": "[OK] ",
+        "error": "[ERROR] ",
+        "warning": "[WARNING] ",
+        "info": "[INFO] ",
+    }
 
-        Returns:
-            Formatted message
-        """
-        return f"[*] {message}..."
-
-    @staticmethod
-    def format_success(message: str) -> str:
-        """Format a success message for console output.
-
-        Args:
-            message: Success message
-
-        Returns:
-            Formatted message
-        """
-        return f"[OK] {message}"
-
-    @staticmethod
-    def format_error(message: str) -> str:
-        """Format an error message for console output.
-
-        Args:
-            message: Error message
-
-        Returns:
-            Formatted message
-        """
-        return f"[ERROR] {message}"
-
-    @staticmethod
-    def format_warning(message: str) -> str:
-        """Format a warning message for console output.
-
-        Args:
-            message: Warning message
-
-        Returns:
-            Formatted message
-        """
-        return f"[WARNING] {message}"
-
-    @staticmethod
-    def format_info(message: str) -> str:
-        """Format an info message for console output.
+    @classmethod
+    def format(cls, level: str, message: str, suffix: str = "") -> str:
+        """Format a console message with its level prefix.
 
         Args:
-            message: Info message
+            level: Message level (progress, success, error, warning, info)
+            message: Message text
+            suffix: Optional text appended after the message
 
         Returns:
             Formatted message
         """
-        return f"[INFO] {message}"
+        return cls._PREFIX[level] + message + suffix
+
+    # Thin per-level wrappers kept for API compatibility
+
+    @classmethod
+    def format_progress(cls, message: str) -> str:
+        """Format a progress message for console output."""
+        return cls.format("progress", message, "...")
+
+    @classmethod
+    def format_success(cls, message: str) -> str:
+        """Format a success message for console output."""
+        return cls.format("success", message)
+
+    @classmethod
+    def format_error(cls, message: str) -> str:
+        """Format an error message for console output."""
+        return cls.format("error", message)
+
+    @classmethod
+    def format_warning(cls, message: str) -> str:
+        """Format a warning message for console output."""
+        return cls.format("warning", message)
+
+    @classmethod
+    def format_info(cls, message: str) -> str:
+        """Format an info message for console output."""
+        return cls.format("info", message)
@@ -1,18 +1,52 @@
 """GitHub API client for fetching commit information."""
 
+import asyncio
+import functools
+import itertools
 import logging
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Optional
 
-from github import Github, GithubException
-from github.Commit import Commit
-from github.Repository import Repository
+import httpx
+from github import Github
 
+from . import http
+from ._patterns import COMMIT_URL_PATTERN
 from .config import get_config
 
 logger = logging.getLogger(__name__)
 
+GITHUB_API_BASE = "https://api.github.com"
+
+# Tokens with fewer remaining requests than this are skipped until their
+# rate-limit window resets
+RATE_LIMIT_FLOOR = 10
+
+# Entries kept in the ETag revalidation cache
+_ETAG_CACHE_SIZE = 1024
+
+# Newlines in each per-file header emitted by format_diff
+_DIFF_HEADER_LINES = 5
+
+# The commits endpoint embeds at most this many files per page
+_COMMIT_FILES_PER_PAGE = 300
+
+
+@functools.lru_cache(maxsize=4)
+def _http_client_for(token: str) -> httpx.Client:
+    """Get the process-wide pooled HTTP client for a GitHub token."""
+    return http.build_client(
+        base_url=GITHUB_API_BASE,
+        headers={
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+        },
+    )
+
 
 @dataclass
 class CommitInfo:
@@ -54,7 +88,88 @@ class GitHubClient:
         config = get_config()
         self.token = token or config.github_token
         self.client = Github(self.token)
-        logger.info("GitHub client initialized")
+        # Rotate through GITHUB_TOKENS (if configured) to multiply the
+        # effective rate limit; an explicit token argument disables rotation
+        if token is None and config.github_tokens:
+            self._tokens = list(dict.fromkeys([self.token, *config.github_tokens]))
+        else:
+            self._tokens = [self.token]
+        self._token_cycle = itertools.cycle(self._tokens)
+        self._rate_limits: dict[str, tuple[int, float]] = {}  # token -> (remaining, reset)
+        # Commit bodies are immutable, so a revalidated ETag always means
+        # the cached body is still good; 304s are free rate-limit-wise
+        self._etag_cache: OrderedDict[str, tuple[str, dict]] = OrderedDict()
+        self._etag_lock = threading.Lock()
+        self._async_http: Optional[httpx.AsyncClient] = None
+        logger.info(f"GitHub client initialized ({len(self._tokens)} token(s))")
+
+    def _next_token(self) -> str:
+        """Pick the next token, skipping any close to their rate limit.
+
+        Tokens with fewer than RATE_LIMIT_FLOOR remaining requests are
+        skipped until their reported reset time has passed. If every token
+        is exhausted, the next one in the cycle is returned anyway and
+        GitHub's error response is surfaced to the caller.
+        """
+        now = time.time()
+        for _ in range(len(self._tokens)):
+            candidate = next(self._token_cycle)
+            state = self._rate_limits.get(candidate)
+            if state is None:
+                return candidate
+            remaining, reset = state
+            if remaining >= RATE_LIMIT_FLOOR or now >= reset:
+                return candidate
+            logger.debug(f"Skipping rate-limited token ({remaining} remaining)")
+        return next(self._token_cycle)
+
+    def _etag_lookup(self, path: str) -> Optional[tuple[str, dict]]:
+        """Get the cached (etag, body) for a path, if any."""
+        with self._etag_lock:
+            entry = self._etag_cache.get(path)
+            if entry is not None:
+                self._etag_cache.move_to_end(path)
+            return entry
+
+    def _etag_store(self, path: str, response: httpx.Response, data: dict) -> None:
+        """Remember a response's ETag and body for later revalidation."""
+        etag = response.headers.get("ETag")
+        if not etag:
+            return
+        with self._etag_lock:
+            self._etag_cache[path] = (etag, data)
+            self._etag_cache.move_to_end(path)
+            while len(self._etag_cache) > _ETAG_CACHE_SIZE:
+                self._etag_cache.popitem(last=False)
+
+    def _record_rate_limit(self, token: str, response: httpx.Response) -> None:
+        """Update per-token rate limit state from response headers."""
+        try:
+            remaining = int(response.headers["X-RateLimit-Remaining"])
+            reset = float(response.headers["X-RateLimit-Reset"])
+        except (KeyError, ValueError):
+            return
+        self._rate_limits[token] = (remaining, reset)
+
+    def _get_async_http(self) -> httpx.AsyncClient:
+        """Get (lazily creating) the async HTTP client for the REST API."""
+        if self._async_http is None or self._async_http.is_closed:
+            self._async_http = http.build_async_client(
+                base_url=GITHUB_API_BASE,
+                headers={
+                    "Authorization": f"Bearer {self.token}",
+                    "Accept": "application/vnd.github+json",
+                },
+            )
+        return self._async_http
+
+    async def aclose(self) -> None:
+        """Close the per-instance async HTTP client, if one was created.
+
+        The shared sync client is process-wide and stays open for reuse.
+        """
+        if self._async_http is not None and not self._async_http.is_closed:
+            await self._async_http.aclose()
 
     def parse_commit_url(self, url: str) -> tuple[str, str, str]:
         """Parse GitHub commit URL to extract owner, repo, and commit SHA.
@@ -68,27 +183,13 @@ class GitHubClient:
         Raises:
             ValueError: If URL format is invalid
         """
-        parts = url.rstrip("/").split("/")
-
-        try:
-            if "github.com" in url:
-                # Find the github.com part
-                gh_index = next(i for i, p in enumerate(parts) if "github.com" in p)
-                owner = parts[gh_index + 1]
-                repo = parts[gh_index + 2]
-                # commit should be at gh_index + 3
-                if parts[gh_index + 3] == "commit":
-                    sha = parts[gh_index + 4]
-                else:
-                    raise ValueError("Invalid commit URL format")
-                return owner, repo, sha
-            else:
-                raise ValueError("Not a GitHub URL")
-        except (IndexError, StopIteration, ValueError) as e:
+        match = COMMIT_URL_PATTERN.search(url)
+        if match is None:
             raise ValueError(
                 f"Invalid GitHub commit URL: {url}. "
                 "Expected format: https://github.com/owner/repo/commit/sha"
-            ) from e
+            )
+        return match.group("owner"), match.group("repo"), match.group("sha")
 
     def get_commit(
         self, owner: str, repo: str, sha: str
@@ -104,25 +205,84 @@ class GitHubClient:
             Tuple of (CommitInfo, List[FileChange])
 
         Raises:
-            GithubException: If commit cannot be fetched
+            httpx.HTTPError: If commit cannot be fetched
         """
         try:
             logger.info(f"Fetching commit {sha} from {owner}/{repo}")
-            repository = self.client.get_repo(f"{owner}/{repo}")
-            commit = repository.get_commit(sha)
+            path = f"/repos/{owner}/{repo}/commits/{sha}"
+            cached = self._etag_lookup(path)
+            headers = {"If-None-Match": cached[0]} if cached else None
+
+            token = self._next_token()
+            response = _http_client_for(token).get(path, headers=headers)
+            self._record_rate_limit(token, response)
 
-            commit_info = self._extract_commit_info(commit, repository)
-            file_changes = self._extract_file_changes(commit)
+            if response.status_code == 304 and cached:
+                logger.info(f"ETag revalidated for {sha[:8]} (304, no quota used)")
+                data = cached[1]
+            else:
+                response.raise_for_status()
+                data = response.json()
+                self._collect_remaining_files(token, path, data)
+                self._etag_store(path, response, data)
+
+            commit_info, file_changes = self._parse_rest_commit(
+                data, f"{owner}/{repo}"
+            )
 
             logger.info(
                 f"Successfully fetched commit: {len(file_changes)} files changed"
             )
             return commit_info, file_changes
 
-        except GithubException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Failed to fetch commit: {e}")
             raise
 
+    def _collect_remaining_files(
+        self, token: str, path: str, data: dict
+    ) -> None:
+        """Fetch file-list pages beyond the first for very large commits.
+
+        The commits endpoint embeds at most 300 files per page; commits
+        touching more need ?page=N requests whose "files" arrays are
+        appended to the first page in place.
+        """
+        files = data.get("files")
+        if files is None or len(files) < _COMMIT_FILES_PER_PAGE:
+            return
+
+        client = _http_client_for(token)
+        page = 2
+        while True:
+            response = client.get(path, params={"page": page})
+            self._record_rate_limit(token, response)
+            response.raise_for_status()
+            more = response.json().get("files") or []
+            files.extend(more)
+            logger.debug(f"Fetched commit file page {page} ({len(more)} files)")
+            if len(more) < _COMMIT_FILES_PER_PAGE:
+                break
+            page += 1
+
+    async def _acollect_remaining_files(self, path: str, data: dict) -> None:
+        """Fetch file-list pages beyond the first (async version)."""
+        files = data.get("files")
+        if files is None or len(files) < _COMMIT_FILES_PER_PAGE:
+            return
+
+        client = self._get_async_http()
+        page = 2
+        while True:
+            response = await client.get(path, params={"page": page})
+            response.raise_for_status()
+            more = response.json().get("files") or []
+            files.extend(more)
+            logger.debug(f"Fetched commit file page {page} ({len(more)} files)")
+            if len(more) < _COMMIT_FILES_PER_PAGE:
+                break
+            page += 1
+
     def get_commit_by_url(self, url: str) -> tuple[CommitInfo, List[FileChange]]:
         """Fetch commit information using a GitHub URL.
 
@@ -135,40 +295,114 @@ class GitHubClient:
         owner, repo, sha = self.parse_commit_url(url)
         return self.get_commit(owner, repo, sha)
 
-    def _extract_commit_info(self, commit: Commit, repo: Repository) -> CommitInfo:
-        """Extract structured information from a GitHub commit."""
-        # Convert PaginatedList to list to get length
-        files_list = list(commit.files)
-
-        return CommitInfo(
-            sha=commit.sha,
-            message=commit.commit.message,
-            author_name=commit.commit.author.name,
-            author_email=commit.commit.author.email,
-            date=commit.commit.author.date,
-            repository=repo.full_name,
-            url=commit.html_url,
-            files_changed=len(files_list),
-            additions=commit.stats.additions,
-            deletions=commit.stats.deletions,
+    async def aget_commit(
+        self, owner: str, repo: str, sha: str
+    ) -> tuple[CommitInfo, List[FileChange]]:
+        """Fetch commit information from GitHub (async version).
+
+        Uses the REST API directly so multiple fetches can run concurrently
+        on one event loop.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            sha: Commit SHA
+
+        Returns:
+            Tuple of (CommitInfo, List[FileChange])
+
+        Raises:
+            httpx.HTTPStatusError: If commit cannot be fetched
+        """
+        logger.info(f"Fetching commit {sha} from {owner}/{repo} (async)")
+        path = f"/repos/{owner}/{repo}/commits/{sha}"
+        cached = self._etag_lookup(path)
+        headers = {"If-None-Match": cached[0]} if cached else None
+
+        http = self._get_async_http()
+        response = await http.get(path, headers=headers)
+
+        if response.status_code == 304 and cached:
+            logger.info(f"ETag revalidated for {sha[:8]} (304, no quota used)")
+            data = cached[1]
+        else:
+            response.raise_for_status()
+            data = response.json()
+            await self._acollect_remaining_files(path, data)
+            self._etag_store(path, response, data)
+
+        return self._parse_rest_commit(data, f"{owner}/{repo}")
+
+    async def aget_commits_bulk(
+        self, specs: List[tuple[str, str, str]]
+    ) -> List[tuple[CommitInfo, List[FileChange]]]:
+        """Fetch several commits concurrently (async version).
+
+        The fetches overlap on one event loop and HTTP/2 multiplexes them
+        over the pooled connection, so N commits take roughly as long as
+        the slowest fetch instead of the sum of the round-trips.
+
+        Args:
+            specs: List of (owner, repo, sha) tuples
+
+        Returns:
+            List of (CommitInfo, List[FileChange]) tuples, in input order
+        """
+        logger.info(f"Fetching {len(specs)} commits concurrently")
+        return list(
+            await asyncio.gather(
+                *(self.aget_commit(owner, repo, sha) for owner, repo, sha in specs)
+            )
+        )
+
+    async def aget_commit_by_url(
+        self, url: str
+    ) -> tuple[CommitInfo, List[FileChange]]:
+        """Fetch commit information using a GitHub URL (async version).
+
+        Args:
+            url: GitHub commit URL
+
+        Returns:
+            Tuple of (CommitInfo, List[FileChange])
+        """
+        owner, repo, sha = self.parse_commit_url(url)
+        return await self.aget_commit(owner, repo, sha)
+
+    def _parse_rest_commit(
+        self, data: dict, repository: str
+    ) -> tuple[CommitInfo, List[FileChange]]:
+        """Build CommitInfo and FileChange list from a REST API payload."""
+        commit = data["commit"]
+        author = commit["author"]
+        files = data.get("files", [])
+
+        commit_info = CommitInfo(
+            sha=data["sha"],
+            message=commit["message"],
+            author_name=author["name"],
+            author_email=author["email"],
+            date=datetime.fromisoformat(author["date"].replace("Z", "+00:00")),
+            repository=repository,
+            url=data["html_url"],
+            files_changed=len(files),
+            additions=data["stats"]["additions"],
+            deletions=data["stats"]["deletions"],
         )
 
-    def _extract_file_changes(self, commit: Commit) -> List[FileChange]:
-        """Extract file changes from a commit."""
-        file_changes = []
-
-        for file in commit.files:
-            file_change = FileChange(
-                filename=file.filename,
-                status=file.status,
-                additions=file.additions,
-                deletions=file.deletions,
-                changes=file.changes,
-                patch=file.patch if hasattr(file, "patch") else None,
+        file_changes = [
+            FileChange(
+                filename=f["filename"],
+                status=f["status"],
+                additions=f["additions"],
+                deletions=f["deletions"],
+                changes=f["changes"],
+                patch=f.get("patch"),
             )
-            file_changes.append(file_change)
+            for f in files
+        ]
 
-        return file_changes
+        return commit_info, file_changes
 
     def format_diff(
         self, file_changes: List[FileChange], max_lines: Optional[int] = None
@@ -196,26 +430,34 @@ class GitHubClient:
             header += f"{'='*60}\n"
 
             diff_parts.append(header)
-            total_lines += header.count("\n")
+            total_lines += _DIFF_HEADER_LINES
 
             if change.patch:
-                patch_lines = change.patch.split("\n")
+                # Count lines without materializing a list; the patch is
+                # only split when it actually needs truncating
+                patch_line_count = change.patch.count("\n") + 1
                 remaining_lines = max_lines - total_lines
 
                 if remaining_lines <= 0:
                     truncated = True
                     break
 
-                if len(patch_lines) > remaining_lines:
-                    diff_parts.append("\n".join(patch_lines[:remaining_lines]))
+                if patch_line_count > remaining_lines:
+                    diff_parts.append(
+                        "\n".join(
+                            itertools.islice(
+                                iter(change.patch.splitlines()), remaining_lines
+                            )
+                        )
+                    )
                     diff_parts.append(
-                        f"\n... (truncated {len(patch_lines) - remaining_lines} lines)"
+                        f"\n... (truncated {patch_line_count - remaining_lines} lines)"
                     )
                     truncated = True
                     break
                 else:
                     diff_parts.append(change.patch)
-                    total_lines += len(patch_lines)
+                    total_lines += patch_line_count
             else:
                 diff_parts.append("(Binary file or no diff available)\n")
                 total_lines += 1
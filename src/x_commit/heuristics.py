@@ -0,0 +1,213 @@
+"""Local heuristics for summarizing trivial commits without Claude."""
+
+import logging
+import re
+from typing import Optional
+
+from .github_client import FileChange
+
+logger = logging.getLogger(__name__)
+
+# Comment prefixes per file extension. Resolved per file because the
+# same character means different things by language: '#' is a
+# preprocessor directive in C, and a leading '*' is usually pointer
+# code, so neither can be treated as a comment marker globally.
+_C_STYLE_PREFIXES = ("//", "/*", "*/")
+_COMMENT_PREFIXES_BY_EXT = {
+    ".py": ("#", '"""', "'''"),
+    ".rb": ("#",),
+    ".sh": ("#",),
+    ".bash": ("#",),
+    ".yml": ("#",),
+    ".yaml": ("#",),
+    ".toml": ("#",),
+    ".js": _C_STYLE_PREFIXES,
+    ".jsx": _C_STYLE_PREFIXES,
+    ".ts": _C_STYLE_PREFIXES,
+    ".tsx": _C_STYLE_PREFIXES,
+    ".java": _C_STYLE_PREFIXES,
+    ".go": _C_STYLE_PREFIXES,
+    ".rs": _C_STYLE_PREFIXES,
+    ".c": _C_STYLE_PREFIXES,
+    ".h": _C_STYLE_PREFIXES,
+    ".cpp": _C_STYLE_PREFIXES,
+    ".hpp": _C_STYLE_PREFIXES,
+    ".cs": _C_STYLE_PREFIXES,
+    ".swift": _C_STYLE_PREFIXES,
+    ".kt": _C_STYLE_PREFIXES,
+    ".css": ("/*", "*/"),
+    ".html": ("<!--",),
+    ".xml": ("<!--",),
+}
+
+# Files whose changes are typically just a version field
+_VERSION_FILES = {
+    "package.json",
+    "pyproject.toml",
+    "setup.py",
+    "Cargo.toml",
+    "VERSION",
+    "version.py",
+    "__init__.py",
+}
+
+# A changed line that looks like a version field or bare version number
+_VERSION_LINE_PATTERN = re.compile(
+    r"version.*\d+\.\d+|^v?\d+\.\d+(\.\d+)?$", re.IGNORECASE
+)
+
+# Conventional-commit prefixes that mark routine maintenance work
+_TRIVIAL_MESSAGE_PATTERN = re.compile(
+    r"^(chore|bump|typo)(\(.*\))?!?:", re.IGNORECASE
+)
+
+# Commits touching fewer changed lines than this get a local summary
+_TINY_CHANGE_LINES = 5
+
+_KOREAN_SUMMARIES = {
+    "whitespace": "포맷팅/공백만 변경된 커밋입니다. 코드 동작에는 영향이 없습니다.",
+    "comments": "주석만 변경된 커밋입니다. 코드 동작에는 영향이 없습니다.",
+    "version_bump": "버전 번호만 올린 커밋입니다.",
+    "deletions": "파일 삭제만 포함된 커밋입니다.",
+    "trivial_message": "단순 유지보수 커밋입니다: {message}",
+    "tiny": "5줄 미만의 소규모 변경입니다: {message}",
+}
+
+_ENGLISH_SUMMARIES = {
+    "whitespace": "Formatting/whitespace-only change. No behavioral impact.",
+    "comments": "Comment-only change. No behavioral impact.",
+    "version_bump": "Version bump only.",
+    "deletions": "File deletions only.",
+    "trivial_message": "Routine maintenance commit: {message}",
+    "tiny": "Very small change (under 5 lines): {message}",
+}
+
+
+def _comment_prefixes(filename: str) -> Optional[tuple[str, ...]]:
+    """Comment prefixes for a file, or None if its type is unknown."""
+    dot = filename.rfind(".")
+    if dot == -1:
+        return None
+    return _COMMENT_PREFIXES_BY_EXT.get(filename[dot:].lower())
+
+
+def _is_comment_only(file_changes: list[FileChange]) -> bool:
+    """Check whether every changed line is a comment in its own language.
+
+    Files of unknown type fail the check: guessing a comment syntax
+    risks declaring a behavioral change comment-only.
+    """
+    saw_comment = False
+    for change in file_changes:
+        prefixes = _comment_prefixes(change.filename)
+        if prefixes is None:
+            return False
+
+        added, removed = _changed_lines(change.patch)
+        for line in added + removed:
+            line = line.strip()
+            if not line:
+                continue
+            if not line.startswith(prefixes):
+                return False
+            saw_comment = True
+
+    return saw_comment
+
+
+def _changed_lines(patch: str) -> tuple[list[str], list[str]]:
+    """Split a unified diff patch into added and removed line contents."""
+    added = []
+    removed = []
+    for line in patch.splitlines():
+        if line.startswith(("+++", "---", "@@")):
+            continue
+        if line.startswith("+"):
+            added.append(line[1:])
+        elif line.startswith("-"):
+            removed.append(line[1:])
+    return added, removed
+
+
+def classify(
+    file_changes: list[FileChange],
+    language: str = "korean",
+    commit_message: Optional[str] = None,
+) -> Optional[str]:
+    """Classify a commit as trivial and return a ready-made summary.
+
+    Detects changes that need no LLM analysis: pure deletions,
+    whitespace/formatting-only diffs, comment-only diffs, version
+    bumps, routine chore/bump/typo commits, and changes under five
+    lines. For these, a local scan replaces the Claude round-trip.
+
+    Args:
+        file_changes: List of file changes
+        language: Language for the summary ('korean' or 'english')
+        commit_message: Optional commit message for the message-based
+            rules; its first line is echoed in those summaries
+
+    Returns:
+        A short summary string for trivial commits, None otherwise
+    """
+    if not file_changes:
+        return None
+
+    summaries = (
+        _ENGLISH_SUMMARIES if language == "english" else _KOREAN_SUMMARIES
+    )
+
+    first_line = commit_message.splitlines()[0].strip() if commit_message else ""
+
+    if first_line and _TRIVIAL_MESSAGE_PATTERN.match(first_line):
+        return summaries["trivial_message"].format(message=first_line)
+
+    total_changed = sum(
+        change.additions + change.deletions for change in file_changes
+    )
+    if first_line and 0 < total_changed < _TINY_CHANGE_LINES:
+        return summaries["tiny"].format(message=first_line)
+
+    if all(change.status == "removed" for change in file_changes):
+        return summaries["deletions"]
+
+    # The content rules need every patch; binary or oversized files have
+    # none, so bail out to the full analysis
+    if any(change.patch is None for change in file_changes):
+        return None
+
+    added: list[str] = []
+    removed: list[str] = []
+    for change in file_changes:
+        file_added, file_removed = _changed_lines(change.patch)
+        added.extend(file_added)
+        removed.extend(file_removed)
+
+    if not added and not removed:
+        return None
+
+    stripped_added = [line.strip() for line in added]
+    stripped_removed = [line.strip() for line in removed]
+
+    # Whitespace-only: nothing but blank changes, or the same lines in
+    # the same order re-indented (compared in order — a permutation of
+    # lines is a reordering, which can change behavior)
+    if all(not line for line in stripped_added + stripped_removed):
+        return summaries["whitespace"]
+    if stripped_added == stripped_removed:
+        return summaries["whitespace"]
+
+    if _is_comment_only(file_changes):
+        return summaries["comments"]
+
+    changed = [line for line in stripped_added + stripped_removed if line]
+
+    touched_files = {
+        change.filename.rsplit("/", 1)[-1] for change in file_changes
+    }
+    if touched_files <= _VERSION_FILES and all(
+        _VERSION_LINE_PATTERN.search(line) for line in changed
+    ):
+        return summaries["version_bump"]
+
+    return None
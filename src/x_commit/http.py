@@ -0,0 +1,46 @@
+"""Shared HTTP client construction for process-wide connection pools."""
+
+import httpx
+
+# One pool tuning for every outbound client (GitHub, Anthropic): HTTP/2
+# multiplexes concurrent requests over warm TLS connections, the connect
+# timeout fails fast on network trouble, and keep-alives stay warm long
+# enough to span quiet periods between analyses
+TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+LIMITS = httpx.Limits(
+    max_connections=50,
+    max_keepalive_connections=20,
+    keepalive_expiry=300,
+)
+
+
+def build_client(**kwargs) -> httpx.Client:
+    """Build an httpx.Client with the shared pool tuning.
+
+    Args:
+        **kwargs: Passed through to httpx.Client (base_url, headers, ...);
+            http2/timeout/limits default to the shared tuning.
+
+    Returns:
+        A configured httpx.Client
+    """
+    kwargs.setdefault("http2", True)
+    kwargs.setdefault("timeout", TIMEOUT)
+    kwargs.setdefault("limits", LIMITS)
+    return httpx.Client(**kwargs)
+
+
+def build_async_client(**kwargs) -> httpx.AsyncClient:
+    """Build an httpx.AsyncClient with the shared pool tuning.
+
+    Args:
+        **kwargs: Passed through to httpx.AsyncClient;
+            http2/timeout/limits default to the shared tuning.
+
+    Returns:
+        A configured httpx.AsyncClient
+    """
+    kwargs.setdefault("http2", True)
+    kwargs.setdefault("timeout", TIMEOUT)
+    kwargs.setdefault("limits", LIMITS)
+    return httpx.AsyncClient(**kwargs)
@@ -1,12 +1,26 @@
 """Pattern-based message filtering using .xcommitignore file."""
 
+import functools
 import logging
 import re
+import sys
 from pathlib import Path
 from typing import Optional
 
+# Optional: with many literal patterns, an Aho-Corasick automaton scans
+# the message once in C instead of one substring pass per pattern. The
+# plain loop below remains the fallback when it is not installed.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+# Marks a line in the ignore file as a regular expression
+_REGEX_PREFIX = 'regex:'
+_REGEX_PREFIX_LEN = len(_REGEX_PREFIX)
+
 
 class IgnorePatternManager:
     """Manages ignore patterns from .xcommitignore file."""
@@ -22,7 +36,12 @@ class IgnorePatternManager:
 
         self.ignore_file_path = ignore_file_path
         self.patterns = []
+        self.patterns_b = []
         self.regex_patterns = []
+        self._automaton = None
+        self._literal_regex = None
+        self._combined_regex = None
+        self._regex_sources = []
         self._load_patterns()
 
         logger.info(f"Loaded {len(self.patterns)} string patterns and {len(self.regex_patterns)} regex patterns from {ignore_file_path}")
@@ -41,31 +60,75 @@ class IgnorePatternManager:
             return
 
         try:
-            with open(self.ignore_file_path, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-
-                    # Skip comments and empty lines
-                    if not line or line.startswith('#'):
-                        continue
-
-                    # Check if it's a regex pattern
-                    if line.startswith('regex:'):
-                        pattern_str = line[6:].strip()  # Remove 'regex:' prefix
-                        try:
-                            compiled_pattern = re.compile(pattern_str, re.IGNORECASE)
-                            self.regex_patterns.append(compiled_pattern)
-                            logger.debug(f"Loaded regex pattern from line {line_num}: {pattern_str}")
-                        except re.error as e:
-                            logger.warning(f"Invalid regex pattern at line {line_num}: {pattern_str} - {e}")
-                    else:
-                        # Literal string pattern (will be matched case-insensitively)
-                        self.patterns.append(line.lower())
-                        logger.debug(f"Loaded string pattern from line {line_num}: {line}")
+            # Read as bytes and filter comments/blanks with cheap bytes
+            # comparisons; only surviving lines pay for UTF-8 decoding
+            raw_lines = self.ignore_file_path.read_bytes().split(b'\n')
+            for line_num, raw in enumerate(raw_lines, 1):
+                raw = raw.strip()
+
+                # Skip comments and empty lines
+                if not raw or raw[:1] == b'#':
+                    continue
+
+                line = raw.decode('utf-8')
+
+                # Check if it's a regex pattern
+                if line.startswith(_REGEX_PREFIX):
+                    pattern_str = line[_REGEX_PREFIX_LEN:].strip()
+                    try:
+                        compiled_pattern = re.compile(pattern_str, re.IGNORECASE)
+                        self.regex_patterns.append(compiled_pattern)
+                        logger.debug(f"Loaded regex pattern from line {line_num}: {pattern_str}")
+                    except re.error as e:
+                        logger.warning(f"Invalid regex pattern at line {line_num}: {pattern_str} - {e}")
+                else:
+                    # Literal string pattern (matched case-insensitively);
+                    # interned so repeated loads share one string object
+                    self.patterns.append(sys.intern(line.lower()))
+                    logger.debug(f"Loaded string pattern from line {line_num}: {line}")
 
         except Exception as e:
             logger.error(f"Failed to load ignore patterns from {self.ignore_file_path}: {e}")
 
+        # Encoded copies for the fallback substring loop; bytes containment
+        # runs on memmem rather than walking code points. The str list is
+        # kept for reporting which pattern matched.
+        self.patterns_b = [p.encode('utf-8') for p in self.patterns]
+
+        if ahocorasick is not None and self.patterns:
+            automaton = ahocorasick.Automaton()
+            for pattern in self.patterns:
+                automaton.add_word(pattern, pattern)
+            automaton.make_automaton()
+            self._automaton = automaton
+        elif self.patterns:
+            # Without the automaton, an escaped alternation still checks
+            # every literal in one engine pass; the matched text is the
+            # pattern itself since both sides are lowercased. The bytes
+            # loop stays as the last resort if compilation fails.
+            try:
+                self._literal_regex = re.compile(
+                    "|".join(re.escape(p) for p in self.patterns)
+                )
+            except re.error as e:
+                logger.warning(f"Could not combine literal patterns: {e}")
+
+        # Merge the regex patterns into one alternation so a message is
+        # checked with a single engine call; named groups map the match
+        # back to its source pattern for logging. Falls back to the
+        # per-pattern loop if the sources cannot be combined (e.g. two
+        # patterns defining the same group name).
+        if self.regex_patterns:
+            self._regex_sources = [p.pattern for p in self.regex_patterns]
+            combined = "|".join(
+                f"(?P<p{i}>{source})"
+                for i, source in enumerate(self._regex_sources)
+            )
+            try:
+                self._combined_regex = re.compile(combined, re.IGNORECASE)
+            except re.error as e:
+                logger.warning(f"Could not combine regex patterns: {e}")
+
     def should_ignore(self, message: str) -> tuple[bool, Optional[str]]:
         """Check if a message should be ignored based on loaded patterns.
 
@@ -82,17 +145,45 @@ class IgnorePatternManager:
 
         message_lower = message.lower()
 
-        # Check literal string patterns (case-insensitive substring match)
-        for pattern in self.patterns:
-            if pattern in message_lower:
+        # Check literal string patterns (case-insensitive substring match);
+        # the automaton finds any of them in a single scan when available
+        if self._automaton is not None:
+            hit = next(self._automaton.iter(message_lower), None)
+            if hit is not None:
+                _, pattern = hit
                 logger.debug(f"Message matches string pattern: {pattern}")
                 return True, pattern
-
-        # Check regex patterns
-        for regex_pattern in self.regex_patterns:
-            if regex_pattern.search(message):
-                logger.debug(f"Message matches regex pattern: {regex_pattern.pattern}")
-                return True, f"regex:{regex_pattern.pattern}"
+        elif self._literal_regex is not None:
+            match = self._literal_regex.search(message_lower)
+            if match:
+                pattern = match.group(0)
+                logger.debug(f"Message matches string pattern: {pattern}")
+                return True, pattern
+        else:
+            msg_b = message_lower.encode('utf-8', 'replace')
+            for pattern, pattern_b in zip(self.patterns, self.patterns_b):
+                if pattern_b in msg_b:
+                    logger.debug(f"Message matches string pattern: {pattern}")
+                    return True, pattern
+
+        # Check regex patterns (one combined search when possible)
+        if self._combined_regex is not None:
+            match = self._combined_regex.search(message)
+            if match:
+                # Scan the wrapper groups rather than trusting lastgroup,
+                # which can point at a named group inside a user pattern
+                pattern = next(
+                    source
+                    for i, source in enumerate(self._regex_sources)
+                    if match.group(f"p{i}") is not None
+                )
+                logger.debug(f"Message matches regex pattern: {pattern}")
+                return True, f"regex:{pattern}"
+        else:
+            for regex_pattern in self.regex_patterns:
+                if regex_pattern.search(message):
+                    logger.debug(f"Message matches regex pattern: {regex_pattern.pattern}")
+                    return True, f"regex:{regex_pattern.pattern}"
 
         return False, None
 
@@ -102,14 +193,32 @@ class IgnorePatternManager:
         Useful if the file has been modified during runtime.
         """
         self.patterns = []
+        self.patterns_b = []
         self.regex_patterns = []
+        self._automaton = None
+        self._literal_regex = None
+        self._combined_regex = None
+        self._regex_sources = []
         self._load_patterns()
         logger.info(f"Reloaded patterns from {self.ignore_file_path}")
 
 
+@functools.lru_cache(maxsize=8)
+def _get_manager(path: Path, mtime: Optional[float]) -> IgnorePatternManager:
+    """Get a cached manager for a resolved path and file mtime.
+
+    The mtime is part of the key so an edited ignore file produces a
+    fresh manager while unchanged files skip the re-read and recompile.
+    """
+    return IgnorePatternManager(path)
+
+
 def should_ignore_message(message: str, ignore_file_path: Optional[Path] = None) -> bool:
     """Convenience function to check if a message should be ignored.
 
+    The pattern manager is cached per (path, mtime), so bulk filtering
+    no longer re-reads and recompiles the ignore file on every call.
+
     Args:
         message: The message text to check
         ignore_file_path: Path to .xcommitignore file (optional)
@@ -117,6 +226,11 @@ def should_ignore_message(message: str, ignore_file_path: Optional[Path] = None)
     Returns:
         True if message should be ignored
     """
-    manager = IgnorePatternManager(ignore_file_path)
-    should_ignore, _ = manager.should_ignore(message)
+    path = (ignore_file_path or Path(".xcommitignore")).resolve()
+    try:
+        mtime = path.stat().st_mtime
+    except OSError:
+        mtime = None
+
+    should_ignore, _ = _get_manager(path, mtime).should_ignore(message)
     return should_ignore
@@ -1,10 +1,13 @@
 """Message parser for extracting GitHub commit information from Slack messages."""
 
+import functools
 import logging
 import re
 from dataclasses import dataclass
 from typing import Optional
 
+from ._patterns import COMMIT_URL_PATTERN
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,38 +27,61 @@ class ParsedCommit:
 class MessageParser:
     """Parser for extracting GitHub commit information from various message formats."""
 
-    # GitHub commit URL pattern
-    COMMIT_URL_PATTERN = re.compile(
-        r"github\.com/(?P<owner>[^/\s]+)/(?P<repo>[^/\s]+)/commit/(?P<sha>[a-f0-9]{7,40})",
-        re.IGNORECASE
-    )
+    # All patterns compile with re.ASCII: GitHub URLs are ASCII-only, and
+    # the flag lets case-insensitive matching skip the unicode case tables
+
+    # GitHub commit URL pattern (shared with GitHubClient)
+    COMMIT_URL_PATTERN = COMMIT_URL_PATTERN
 
     # GitHub Slack app format: "user pushed to branch: url - message"
     GITHUB_SLACK_FORMAT = re.compile(
         r"(?P<author>\S+)\s+pushed\s+to\s+(?P<branch>\S+):\s+"
         r"(?P<url>https?://github\.com/[^/]+/[^/]+/commit/[a-f0-9]+)"
         r"(?:\s+-\s+(?P<message>.+))?",
-        re.IGNORECASE
+        re.IGNORECASE | re.ASCII
     )
 
     # GitHub Slack app new format: "1 new commit pushed to _branch_ by author"
     GITHUB_SLACK_NEW_FORMAT = re.compile(
         r"pushed\s+to\s+[_*]?(?P<branch>[^_*\s]+)[_*]?\s+by\s+(?P<author>\S+)",
-        re.IGNORECASE
+        re.IGNORECASE | re.ASCII
     )
 
     # Markdown link format: [text](url)
     MARKDOWN_LINK_PATTERN = re.compile(
         r"\[([^\]]+)\]\((?P<url>https?://github\.com/[^/]+/[^/]+/commit/[a-f0-9]+)\)",
-        re.IGNORECASE
+        re.IGNORECASE | re.ASCII
     )
 
     # Slack link format: <url|text> or <url>
     SLACK_LINK_PATTERN = re.compile(
         r"<(?P<url>https?://github\.com/[^/|>]+/[^/|>]+/commit/[a-f0-9]+)(?:\|[^>]+)?>",
-        re.IGNORECASE
+        re.IGNORECASE | re.ASCII
+    )
+
+    # Single-pass dispatcher over all supported formats: one scan decides
+    # which handler to run instead of trying up to four patterns in turn.
+    # Simplified (capture-free) variants of the patterns above, since the
+    # originals share group names and cannot be combined directly.
+    FORMAT_DISPATCH_PATTERN = re.compile(
+        r"(?P<slack_fmt>\S+\s+pushed\s+to\s+\S+:\s+"
+        r"https?://github\.com/[^/]+/[^/]+/commit/[a-f0-9]+)"
+        r"|(?P<slack_link><https?://github\.com/[^/|>]+/[^/|>]+"
+        r"/commit/[a-f0-9]+(?:\|[^>]+)?>)"
+        r"|(?P<md_link>\[[^\]]+\]\(https?://github\.com/[^/]+/[^/]+"
+        r"/commit/[a-f0-9]+\))"
+        r"|(?P<bare>github\.com/[^/\s]+/[^/\s]+/commit/[a-f0-9]{7,40})",
+        re.IGNORECASE | re.ASCII
     )
 
+    # Dispatch group name -> handler method name
+    _FORMAT_HANDLERS = {
+        "slack_fmt": "_parse_github_slack_format",
+        "slack_link": "_parse_slack_link_format",
+        "md_link": "_parse_markdown_link_format",
+        "bare": "_parse_direct_url",
+    }
+
     def parse_message(self, message: str) -> Optional[ParsedCommit]:
         """Parse a message to extract GitHub commit information.
 
@@ -74,25 +100,26 @@ class MessageParser:
         if not message or not isinstance(message, str):
             return None
 
-        # Try GitHub Slack app format first (most structured)
-        parsed = self._parse_github_slack_format(message)
-        if parsed:
-            return parsed
-
-        # Try Slack link format
-        parsed = self._parse_slack_link_format(message)
-        if parsed:
-            return parsed
-
-        # Try Markdown link format
-        parsed = self._parse_markdown_link_format(message)
-        if parsed:
-            return parsed
+        # Fast path: a plain substring test skips all regex work for the
+        # vast majority of Slack messages, which never mention GitHub
+        if "github.com/" not in message:
+            return None
 
-        # Try direct URL extraction
-        parsed = self._parse_direct_url(message)
-        if parsed:
-            return parsed
+        # One combined scan picks the handler (leftmost match wins, with
+        # the more structured formats first at equal positions)
+        match = self.FORMAT_DISPATCH_PATTERN.search(message)
+        if match:
+            handler = getattr(self, self._FORMAT_HANDLERS[match.lastgroup])
+            parsed = handler(message)
+            if parsed:
+                return parsed
+
+        # Rare: dispatcher hit but the strict handler declined, or no
+        # dispatcher match at all — run the original ordered chain
+        for method in self._FORMAT_HANDLERS.values():
+            parsed = getattr(self, method)(message)
+            if parsed:
+                return parsed
 
         logger.debug(f"No GitHub commit URL found in message: {message[:100]}")
         return None
@@ -113,10 +140,12 @@ class MessageParser:
         if not commit_info:
             return None
 
+        owner, repo, sha = commit_info
+
         return ParsedCommit(
-            owner=commit_info["owner"],
-            repo=commit_info["repo"],
-            sha=commit_info["sha"],
+            owner=owner,
+            repo=repo,
+            sha=sha,
             commit_url=url,
             branch=match.group("branch"),
             author=match.group("author"),
@@ -139,10 +168,12 @@ class MessageParser:
         if not commit_info:
             return None
 
+        owner, repo, sha = commit_info
+
         return ParsedCommit(
-            owner=commit_info["owner"],
-            repo=commit_info["repo"],
-            sha=commit_info["sha"],
+            owner=owner,
+            repo=repo,
+            sha=sha,
             commit_url=url,
         )
 
@@ -162,10 +193,12 @@ class MessageParser:
         if not commit_info:
             return None
 
+        owner, repo, sha = commit_info
+
         return ParsedCommit(
-            owner=commit_info["owner"],
-            repo=commit_info["repo"],
-            sha=commit_info["sha"],
+            owner=owner,
+            repo=repo,
+            sha=sha,
             commit_url=url,
         )
 
@@ -192,17 +225,19 @@ class MessageParser:
             commit_url=commit_url,
         )
 
-    def _extract_url_components(self, url: str) -> Optional[dict]:
-        """Extract owner, repo, and sha from a GitHub commit URL."""
-        match = self.COMMIT_URL_PATTERN.search(url)
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _extract_url_components(url: str) -> Optional[tuple[str, str, str]]:
+        """Extract (owner, repo, sha) from a GitHub commit URL.
+
+        Cached: the same URL is extracted by several handlers per message,
+        and re-posted commits recur across messages.
+        """
+        match = COMMIT_URL_PATTERN.search(url)
         if not match:
             return None
 
-        return {
-            "owner": match.group("owner"),
-            "repo": match.group("repo"),
-            "sha": match.group("sha"),
-        }
+        return match.group("owner"), match.group("repo"), match.group("sha")
 
     def is_github_commit_message(self, message: str, bot_id: Optional[str] = None) -> bool:
         """Check if a message contains a GitHub commit reference.
@@ -217,6 +252,11 @@ class MessageParser:
         if not message:
             return False
 
+        # Same substring fast path as parse_message: no "github.com/"
+        # means no commit URL, without running the regex
+        if "github.com/" not in message:
+            return False
+
         # Check if message contains a commit URL
         return self.COMMIT_URL_PATTERN.search(message) is not None
 
@@ -231,6 +271,11 @@ class MessageParser:
         Returns:
             List of ParsedCommit objects
         """
+        # Substring fast path: skip all pattern scans for messages that
+        # cannot contain a commit URL
+        if not message or "github.com/" not in message:
+            return []
+
         commits = []
         seen_shas = set()
 
@@ -251,7 +296,7 @@ class MessageParser:
             if not commit_info:
                 continue
 
-            sha = commit_info["sha"]
+            owner, repo, sha = commit_info
 
             # Avoid duplicates
             if sha in seen_shas:
@@ -261,8 +306,8 @@ class MessageParser:
 
             commits.append(
                 ParsedCommit(
-                    owner=commit_info["owner"],
-                    repo=commit_info["repo"],
+                    owner=owner,
+                    repo=repo,
                     sha=sha,
                     commit_url=url,
                     branch=match.group("branch"),
@@ -299,11 +344,17 @@ class MessageParser:
         return commits
 
 
+@functools.lru_cache(maxsize=1)
+def _default_parser() -> MessageParser:
+    """Get the shared MessageParser (all its state is class-level)."""
+    return MessageParser()
+
+
 # Convenience function
 def parse_commit_from_message(message: str) -> Optional[ParsedCommit]:
     """Parse a message and extract GitHub commit information.
 
-    This is a convenience function that creates a MessageParser
+    This is a convenience function that uses the shared MessageParser
     and calls parse_message().
 
     Args:
@@ -312,5 +363,4 @@ def parse_commit_from_message(message: str) -> Optional[ParsedCommit]:
     Returns:
         ParsedCommit object if successful, None otherwise
     """
-    parser = MessageParser()
-    return parser.parse_message(message)
+    return _default_parser().parse_message(message)
@@ -1,10 +1,21 @@
 """Slack API client for posting messages and handling events."""
 
+import asyncio
+import functools
+import hashlib
 import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional
 
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
+from slack_sdk.http_retry.builtin_handlers import (
+    ConnectionErrorRetryHandler,
+    RateLimitErrorRetryHandler,
+)
 
 from .config import get_config
 from .formatter import MarkdownFormatter
@@ -12,6 +23,80 @@ from .github_client import CommitInfo, FileChange
 
 logger = logging.getLogger(__name__)
 
+# Channel metadata changes rarely; cache conversations.info this long
+_CHANNEL_INFO_TTL = 600.0
+_CHANNEL_INFO_MAX = 512
+
+# Reactions known to be present; repeats skip the API call entirely
+_REACTIONS_SEEN_MAX = 1024
+
+# Canned message text, built once at import
+_PROGRESS_MSG = ":mag: 커밋을 분석하고 있습니다... (30초 정도 소요됩니다)"
+_ERROR_PREFIX = ":x: 분석 중 오류가 발생했습니다:\n```"
+_ERROR_SUFFIX = "```"
+
+# Formatted Slack output keyed by (sha, model, analysis digest):
+# re-posts and update fallbacks reuse the (text, blocks) pair instead
+# of re-running the formatter
+_FORMAT_CACHE_MAX = 128
+_format_cache: "OrderedDict[tuple[str, str, str], tuple[str, list]]" = OrderedDict()
+_format_cache_lock = threading.Lock()
+
+
+def _format_message_cached(
+    commit_info: CommitInfo, analysis: str, model: str
+) -> "tuple[str, list]":
+    """Format a Slack message and its blocks, memoized per analysis.
+
+    The analysis text is folded into the key as a short blake2b digest
+    so a re-analysis of the same commit never serves a stale message.
+
+    Returns:
+        Tuple of (text, blocks); text doubles as the notification
+        fallback when the blocks are sent
+    """
+    digest = hashlib.blake2b(analysis.encode(), digest_size=8).hexdigest()
+    key = (commit_info.sha, model, digest)
+
+    with _format_cache_lock:
+        entry = _format_cache.get(key)
+        if entry is not None:
+            _format_cache.move_to_end(key)
+            return entry
+
+    entry = (
+        MarkdownFormatter.format_slack_message(commit_info, analysis, model),
+        MarkdownFormatter.format_slack_blocks(commit_info, analysis, model),
+    )
+
+    with _format_cache_lock:
+        _format_cache[key] = entry
+        while len(_format_cache) > _FORMAT_CACHE_MAX:
+            _format_cache.popitem(last=False)
+
+    return entry
+
+
+@functools.lru_cache(maxsize=4)
+def _web_client_for(token: str) -> WebClient:
+    """Get the shared WebClient for a token.
+
+    WebClient is stateless and thread-safe, so every SlackClient created
+    with the same token can share one instance instead of rebuilding the
+    underlying HTTP machinery per construction.
+
+    Transient 429s and connection drops retry inside the SDK with
+    Retry-After-aware backoff, so a momentary rate limit no longer
+    forces the caller to redo the expensive upstream analysis.
+    """
+    return WebClient(
+        token=token,
+        retry_handlers=[
+            RateLimitErrorRetryHandler(max_retry_count=3),
+            ConnectionErrorRetryHandler(max_retry_count=3),
+        ],
+    )
+
 
 class SlackClient:
     """Client for interacting with Slack API."""
@@ -22,8 +107,8 @@ class SlackClient:
         Args:
             token: Slack bot token. If not provided, uses config.
         """
-        config = get_config()
-        self.token = token or config.slack_bot_token
+        # Config is only consulted when no explicit token is given
+        self.token = token or get_config().slack_bot_token
 
         if not self.token:
             raise ValueError(
@@ -31,18 +116,39 @@ class SlackClient:
                 "Please install the app to your workspace and add the token to .env"
             )
 
-        self.client = WebClient(token=self.token)
+        self.client = _web_client_for(self.token)
+        # auth.test result; immutable for a given token, fetched once
+        self._bot_user_id: Optional[str] = None
+        self._bot_user_id_lock = threading.Lock()
+        # conversations.info TTL cache: channel ID -> (expires_at, info)
+        self._channel_info_cache: dict[str, tuple[float, dict]] = {}
+        self._channel_info_lock = threading.Lock()
+        # In-flight conversations.info fetches, for single-flight dedup
+        self._channel_inflight: "dict[str, Future]" = {}
+        # Background pool for posts whose result the caller needs later
+        self._executor = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="slack-post"
+        )
+        # LRU of (channel, ts, emoji) reactions this client has added
+        self._reactions_seen: "OrderedDict[tuple[str, str, str], None]" = OrderedDict()
+        self._reactions_seen_lock = threading.Lock()
         logger.info("Slack client initialized")
 
     def post_message(
-        self, channel: str, text: str, thread_ts: Optional[str] = None
+        self,
+        channel: str,
+        text: str,
+        thread_ts: Optional[str] = None,
+        blocks: Optional[list] = None,
     ) -> dict:
         """Post a message to a Slack channel.
 
         Args:
             channel: Channel ID (e.g., "C1234567890")
-            text: Message text (Slack markdown format)
+            text: Message text (Slack markdown format); serves as the
+                notification fallback when blocks are given
             thread_ts: Optional thread timestamp to reply in a thread
+            blocks: Optional Block Kit blocks to send instead of text
 
         Returns:
             Response from Slack API
@@ -52,26 +158,36 @@ class SlackClient:
         """
         try:
             response = self.client.chat_postMessage(
-                channel=channel, text=text, thread_ts=thread_ts
+                channel=channel, text=text, thread_ts=thread_ts, blocks=blocks
             )
 
-            logger.info(
-                f"Posted message to {channel}"
-                + (f" (thread: {thread_ts})" if thread_ts else "")
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Posted message to %s%s",
+                    channel,
+                    f" (thread: {thread_ts})" if thread_ts else "",
+                )
             return response.data
 
         except SlackApiError as e:
-            logger.error(f"Failed to post message: {e.response['error']}")
+            logger.error("Failed to post message: %s", e.response["error"])
             raise
 
-    def update_message(self, channel: str, ts: str, text: str) -> dict:
+    def update_message(
+        self,
+        channel: str,
+        ts: str,
+        text: str,
+        blocks: Optional[list] = None,
+    ) -> dict:
         """Update an existing message.
 
         Args:
             channel: Channel ID
             ts: Message timestamp
-            text: New message text
+            text: New message text; serves as the notification fallback
+                when blocks are given
+            blocks: Optional Block Kit blocks to send instead of text
 
         Returns:
             Response from Slack API
@@ -80,13 +196,15 @@ class SlackClient:
             SlackApiError: If the API call fails
         """
         try:
-            response = self.client.chat_update(channel=channel, ts=ts, text=text)
+            response = self.client.chat_update(
+                channel=channel, ts=ts, text=text, blocks=blocks
+            )
 
-            logger.info(f"Updated message {ts} in {channel}")
+            logger.info("Updated message %s in %s", ts, channel)
             return response.data
 
         except SlackApiError as e:
-            logger.error(f"Failed to update message: {e.response['error']}")
+            logger.error("Failed to update message: %s", e.response["error"])
             raise
 
     def post_analysis_result(
@@ -109,8 +227,70 @@ class SlackClient:
         Returns:
             Response from Slack API
         """
-        message = MarkdownFormatter.format_slack_message(commit_info, analysis, model)
-        return self.post_message(channel, message, thread_ts)
+        message, blocks = _format_message_cached(commit_info, analysis, model)
+        return self.post_message(channel, message, thread_ts, blocks=blocks)
+
+    def finalize_analysis(
+        self,
+        channel: str,
+        ts: str,
+        commit_info: CommitInfo,
+        analysis: str,
+        model: str,
+    ) -> dict:
+        """Turn an existing progress message into the final analysis.
+
+        One chat.update instead of post_analysis_result's second
+        chat.postMessage plus a chat.delete of the progress post.
+
+        Args:
+            channel: Channel ID
+            ts: Timestamp of the progress message to edit
+            commit_info: Commit information
+            analysis: Analysis text from Claude
+            model: Claude model name
+
+        Returns:
+            Response from Slack API
+        """
+        message, blocks = _format_message_cached(commit_info, analysis, model)
+        return self.update_message(channel, ts, message, blocks=blocks)
+
+    def broadcast_analysis(
+        self,
+        channels: "list[str]",
+        commit_info: CommitInfo,
+        analysis: str,
+        model: str,
+    ) -> list:
+        """Post the same analysis to several channels concurrently.
+
+        The message is formatted once (via the format cache) and the
+        per-channel chat.postMessage calls run on a thread pool, so N
+        channels cost roughly one round trip instead of N.
+
+        Args:
+            channels: Channel IDs to post to
+            commit_info: Commit information
+            analysis: Analysis text from Claude
+            model: Claude model name
+
+        Returns:
+            Per-channel results in input order; failed posts are the
+            raised exception instead of a response dict
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        message, blocks = _format_message_cached(commit_info, analysis, model)
+
+        def _post(channel: str):
+            try:
+                return self.post_message(channel, message, blocks=blocks)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=min(8, len(channels) or 1)) as pool:
+            return list(pool.map(_post, channels))
 
     def post_progress_message(self, channel: str, thread_ts: str) -> dict:
         """Post a progress message while analyzing.
@@ -122,8 +302,23 @@ class SlackClient:
         Returns:
             Response from Slack API (contains 'ts' for updating later)
         """
-        message = ":mag: 커밋을 분석하고 있습니다... (30초 정도 소요됩니다)"
-        return self.post_message(channel, message, thread_ts)
+        return self.post_message(channel, _PROGRESS_MSG, thread_ts)
+
+    def submit_progress_message(self, channel: str, thread_ts: str) -> "Future[dict]":
+        """Post the progress message in the background.
+
+        The caller can start the (much longer) analysis immediately and
+        resolve the future for the message 'ts' when it is first needed,
+        fully overlapping the Slack round trip with the analysis work.
+
+        Args:
+            channel: Channel ID
+            thread_ts: Thread timestamp to reply to
+
+        Returns:
+            Future resolving to the Slack API response
+        """
+        return self._executor.submit(self.post_progress_message, channel, thread_ts)
 
     def post_error_message(
         self, channel: str, thread_ts: str, error_message: str
@@ -138,12 +333,17 @@ class SlackClient:
         Returns:
             Response from Slack API
         """
-        message = f":x: 분석 중 오류가 발생했습니다:\n```{error_message}```"
+        message = _ERROR_PREFIX + error_message + _ERROR_SUFFIX
         return self.post_message(channel, message, thread_ts)
 
     def get_channel_info(self, channel: str) -> dict:
         """Get information about a channel.
 
+        Results are cached for 10 minutes: channel metadata changes
+        rarely, and conversations.info is Tier-2 rate-limited. Call
+        invalidate_channel() on rename/archive events to drop an entry
+        early.
+
         Args:
             channel: Channel ID
 
@@ -153,38 +353,220 @@ class SlackClient:
         Raises:
             SlackApiError: If the API call fails
         """
+        now = time.monotonic()
+        with self._channel_info_lock:
+            cached = self._channel_info_cache.get(channel)
+            if cached is not None and cached[0] > now:
+                return cached[1]
+
+            # Single-flight: concurrent misses for the same channel wait
+            # on the first caller's fetch instead of stacking API calls
+            existing = self._channel_inflight.get(channel)
+            if existing is None:
+                future: Future = Future()
+                self._channel_inflight[channel] = future
+
+        if existing is not None:
+            return existing.result()
+
         try:
             response = self.client.conversations_info(channel=channel)
-            return response.data["channel"]
-
-        except SlackApiError as e:
-            logger.error(f"Failed to get channel info: {e.response['error']}")
+            info = response.data["channel"]
+
+        except Exception as e:
+            if isinstance(e, SlackApiError):
+                logger.error(f"Failed to get channel info: {e.response['error']}")
+            with self._channel_info_lock:
+                self._channel_inflight.pop(channel, None)
+            # Waiters see the same failure instead of hanging
+            future.set_exception(e)
             raise
 
+        with self._channel_info_lock:
+            self._channel_inflight.pop(channel, None)
+            if len(self._channel_info_cache) >= _CHANNEL_INFO_MAX:
+                # Drop expired entries first; if the cache is still full,
+                # evict the entry closest to expiry
+                self._channel_info_cache = {
+                    cid: entry
+                    for cid, entry in self._channel_info_cache.items()
+                    if entry[0] > now
+                }
+                if len(self._channel_info_cache) >= _CHANNEL_INFO_MAX:
+                    oldest = min(self._channel_info_cache, key=lambda cid: self._channel_info_cache[cid][0])
+                    del self._channel_info_cache[oldest]
+            self._channel_info_cache[channel] = (now + _CHANNEL_INFO_TTL, info)
+
+        future.set_result(info)
+        return info
+
+    def invalidate_channel(self, channel: str) -> None:
+        """Drop a channel from the info cache.
+
+        Call this on channel_rename / channel_archive events so the next
+        get_channel_info returns fresh metadata before the TTL lapses.
+
+        Args:
+            channel: Channel ID
+        """
+        with self._channel_info_lock:
+            self._channel_info_cache.pop(channel, None)
+
     def get_bot_user_id(self) -> str:
         """Get the bot's user ID.
 
+        The ID never changes for a given token, so auth.test runs once;
+        later calls return the cached value without a network hop.
+
         Returns:
             Bot user ID (e.g., "U1234567890")
 
         Raises:
             SlackApiError: If the API call fails
         """
+        if self._bot_user_id is not None:
+            return self._bot_user_id
+
+        with self._bot_user_id_lock:
+            if self._bot_user_id is not None:
+                return self._bot_user_id
+
+            try:
+                response = self.client.auth_test()
+                self._bot_user_id = response.data["user_id"]
+                return self._bot_user_id
+
+            except SlackApiError as e:
+                logger.error(f"Failed to get bot user ID: {e.response['error']}")
+                raise
+
+    def add_reaction(self, channel: str, timestamp: str, emoji: str) -> None:
+        """Add a reaction emoji to a message.
+
+        Reactions this client already added are remembered, so a repeat
+        (e.g. a re-delivered event) skips both the network call and the
+        already_reacted exception it would raise.
+
+        Returns nothing: callers only care that the reaction landed, so
+        the response body is not materialized.
+
+        Args:
+            channel: Channel ID
+            timestamp: Message timestamp
+            emoji: Emoji name (without colons, e.g., "white_check_mark")
+
+        Raises:
+            SlackApiError: If the API call fails
+        """
+        key = (channel, timestamp, emoji)
+        with self._reactions_seen_lock:
+            if key in self._reactions_seen:
+                logger.debug("Reaction :%s: already added to %s", emoji, timestamp)
+                return
+
         try:
-            response = self.client.auth_test()
-            return response.data["user_id"]
+            self.client.reactions_add(
+                channel=channel, timestamp=timestamp, name=emoji
+            )
+
+            logger.info("Added reaction :%s: to message %s", emoji, timestamp)
 
         except SlackApiError as e:
-            logger.error(f"Failed to get bot user ID: {e.response['error']}")
+            # Don't raise if reaction already exists
+            if e.response["error"] == "already_reacted":
+                logger.debug("Reaction :%s: already exists on %s", emoji, timestamp)
+                self._remember_reaction(key)
+                return
+            logger.error("Failed to add reaction: %s", e.response["error"])
             raise
 
-    def add_reaction(self, channel: str, timestamp: str, emoji: str) -> dict:
-        """Add a reaction emoji to a message.
+        self._remember_reaction(key)
+
+    def _remember_reaction(self, key: "tuple[str, str, str]") -> None:
+        """Record a reaction as present so repeats short-circuit."""
+        with self._reactions_seen_lock:
+            self._reactions_seen[key] = None
+            while len(self._reactions_seen) > _REACTIONS_SEEN_MAX:
+                self._reactions_seen.popitem(last=False)
+
+    def remove_reaction(self, channel: str, timestamp: str, emoji: str) -> None:
+        """Remove a reaction emoji from a message.
+
+        Also forgets the reaction locally so a later add_reaction for
+        the same message goes through again.
 
         Args:
             channel: Channel ID
             timestamp: Message timestamp
-            emoji: Emoji name (without colons, e.g., "white_check_mark")
+            emoji: Emoji name (without colons)
+
+        Raises:
+            SlackApiError: If the API call fails
+        """
+        with self._reactions_seen_lock:
+            self._reactions_seen.pop((channel, timestamp, emoji), None)
+
+        try:
+            self.client.reactions_remove(
+                channel=channel, timestamp=timestamp, name=emoji
+            )
+
+            logger.info("Removed reaction :%s: from message %s", emoji, timestamp)
+
+        except SlackApiError as e:
+            logger.error("Failed to remove reaction: %s", e.response["error"])
+            raise
+
+
+class AsyncSlackClient:
+    """Async counterpart of SlackClient for concurrent Slack calls.
+
+    Wraps slack_sdk's AsyncWebClient (requires the aiohttp extra) so
+    independent calls — e.g. notifying several channels about the same
+    commit — can run under asyncio.gather instead of paying one round
+    trip after another.
+    """
+
+    def __init__(self, token: Optional[str] = None):
+        """Initialize async Slack client.
+
+        Args:
+            token: Slack bot token. If not provided, uses config.
+        """
+        # Imported here so the sync client works without aiohttp installed
+        from slack_sdk.http_retry.builtin_async_handlers import (
+            AsyncConnectionErrorRetryHandler,
+            AsyncRateLimitErrorRetryHandler,
+        )
+        from slack_sdk.web.async_client import AsyncWebClient
+
+        # Config is only consulted when no explicit token is given
+        self.token = token or get_config().slack_bot_token
+
+        if not self.token:
+            raise ValueError(
+                "SLACK_BOT_TOKEN is required. "
+                "Please install the app to your workspace and add the token to .env"
+            )
+
+        self.client = AsyncWebClient(
+            token=self.token,
+            retry_handlers=[
+                AsyncRateLimitErrorRetryHandler(max_retry_count=3),
+                AsyncConnectionErrorRetryHandler(max_retry_count=3),
+            ],
+        )
+        logger.info("Async Slack client initialized")
+
+    async def post_message(
+        self, channel: str, text: str, thread_ts: Optional[str] = None
+    ) -> dict:
+        """Post a message to a Slack channel.
+
+        Args:
+            channel: Channel ID (e.g., "C1234567890")
+            text: Message text (Slack markdown format)
+            thread_ts: Optional thread timestamp to reply in a thread
 
         Returns:
             Response from Slack API
@@ -193,17 +575,183 @@ class SlackClient:
             SlackApiError: If the API call fails
         """
         try:
-            response = self.client.reactions_add(
-                channel=channel, timestamp=timestamp, name=emoji
+            response = await self.client.chat_postMessage(
+                channel=channel, text=text, thread_ts=thread_ts
+            )
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Posted message to %s%s",
+                    channel,
+                    f" (thread: {thread_ts})" if thread_ts else "",
+                )
+            return response.data
+
+        except SlackApiError as e:
+            logger.error("Failed to post message: %s", e.response["error"])
+            raise
+
+    async def update_message(
+        self,
+        channel: str,
+        ts: str,
+        text: str,
+        blocks: Optional[list] = None,
+    ) -> dict:
+        """Update an existing message.
+
+        Args:
+            channel: Channel ID
+            ts: Message timestamp
+            text: New message text; serves as the notification fallback
+                when blocks are given
+            blocks: Optional Block Kit blocks to send instead of text
+
+        Returns:
+            Response from Slack API
+
+        Raises:
+            SlackApiError: If the API call fails
+        """
+        try:
+            response = await self.client.chat_update(
+                channel=channel, ts=ts, text=text, blocks=blocks
             )
 
-            logger.info(f"Added reaction :{emoji}: to message {timestamp}")
+            logger.info("Updated message %s in %s", ts, channel)
             return response.data
 
+        except SlackApiError as e:
+            logger.error("Failed to update message: %s", e.response["error"])
+            raise
+
+    async def add_reaction(self, channel: str, timestamp: str, emoji: str) -> None:
+        """Add a reaction emoji to a message.
+
+        Returns nothing: callers only care that the reaction landed, so
+        the response body is not materialized.
+
+        Args:
+            channel: Channel ID
+            timestamp: Message timestamp
+            emoji: Emoji name (without colons, e.g., "white_check_mark")
+
+        Raises:
+            SlackApiError: If the API call fails
+        """
+        try:
+            await self.client.reactions_add(
+                channel=channel, timestamp=timestamp, name=emoji
+            )
+
+            logger.info("Added reaction :%s: to message %s", emoji, timestamp)
+
         except SlackApiError as e:
             # Don't raise if reaction already exists
             if e.response["error"] == "already_reacted":
-                logger.debug(f"Reaction :{emoji}: already exists on {timestamp}")
-                return {}
-            logger.error(f"Failed to add reaction: {e.response['error']}")
+                logger.debug("Reaction :%s: already exists on %s", emoji, timestamp)
+                return
+            logger.error("Failed to add reaction: %s", e.response["error"])
             raise
+
+    async def add_reactions(
+        self, channel: str, timestamp: str, emojis: "list[str]"
+    ) -> list:
+        """Add several reaction emojis to a message concurrently.
+
+        Slack has no multi-add endpoint, so the per-emoji reactions.add
+        calls are gathered instead of paying one round trip each.
+
+        Args:
+            channel: Channel ID
+            timestamp: Message timestamp
+            emojis: Emoji names (without colons)
+
+        Returns:
+            Per-emoji results in input order; None for success (including
+            already_reacted), the raised exception otherwise
+        """
+        results = await asyncio.gather(
+            *(self.add_reaction(channel, timestamp, emoji) for emoji in emojis),
+            return_exceptions=True,
+        )
+        for emoji, result in zip(emojis, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Failed to add reaction :{emoji}:: {result}")
+        return list(results)
+
+    async def post_analysis_and_react(
+        self,
+        channel: str,
+        thread_ts: str,
+        original_ts: str,
+        commit_info: CommitInfo,
+        analysis: str,
+        model: str,
+        emoji: str = "white_check_mark",
+    ) -> dict:
+        """Post an analysis result and react to the original message at once.
+
+        The analysis post and the reaction are independent, so issuing
+        them concurrently removes one round trip from every analyzed
+        commit.
+
+        Args:
+            channel: Channel ID
+            thread_ts: Thread timestamp to reply to
+            original_ts: Timestamp of the message to react to
+            commit_info: Commit information
+            analysis: Analysis text from Claude
+            model: Claude model name
+            emoji: Reaction emoji name (without colons)
+
+        Returns:
+            Response from the chat.postMessage call
+
+        Raises:
+            SlackApiError: If the analysis post fails; a failed reaction
+                is logged but never fails the analysis
+        """
+        message, _ = _format_message_cached(commit_info, analysis, model)
+        post_result, react_result = await asyncio.gather(
+            self.post_message(channel, message, thread_ts),
+            self.add_reaction(channel, original_ts, emoji),
+            return_exceptions=True,
+        )
+
+        # add_reaction already swallows already_reacted; anything else is
+        # cosmetic, so log it rather than losing the posted analysis
+        if isinstance(react_result, BaseException):
+            logger.warning(f"Failed to add reaction :{emoji}:: {react_result}")
+
+        if isinstance(post_result, BaseException):
+            raise post_result
+        return post_result
+
+    async def post_analysis_fanout(
+        self,
+        targets: list[tuple[str, Optional[str]]],
+        commit_info: CommitInfo,
+        analysis: str,
+        model: str,
+    ) -> list:
+        """Post the same analysis to several channels concurrently.
+
+        Args:
+            targets: List of (channel, thread_ts) pairs; thread_ts may be None
+            commit_info: Commit information
+            analysis: Analysis text from Claude
+            model: Claude model name
+
+        Returns:
+            Per-target results in input order; failed posts are the
+            SlackApiError instance instead of a response dict
+        """
+        message, _ = _format_message_cached(commit_info, analysis, model)
+        return await asyncio.gather(
+            *(
+                self.post_message(channel, message, thread_ts)
+                for channel, thread_ts in targets
+            ),
+            return_exceptions=True,
+        )